@@ -1,281 +1,418 @@
 # File: analyze_errors.py
 # Owner: silicastormsiam
 # Purpose: Analyze parse_errors_report.txt, rats_data.json, parsed_jobs_output.txt, parsed_jobs_output.html, and combined_reports.txt to identify errors and suggest recovery actions for the R.A.T.S. project, with focus on HTML rendering stability, Google Careers data discrepancies, dropdown functionality, and large file handling.
-# Version Control: 1.18
+# Version Control: 1.42
 # Change Log:
-# - 2025-08-07: Version 1.14 - Enhanced diagnostics for JavaScript syntax and dropdown functionality; refined recovery suggestions for non-English skips and Google Careers parsing; retained large file handling and f-string diagnostics.
-# - 2025-08-07: Version 1.15 - Added diagnostics for processing failures and file access errors; enhanced Google Careers parsing checks; added checks for redundant File dropdown and Remote filter; retained JavaScript, dropdown, and non-English skip diagnostics.
-# - 2025-08-07: Version 1.16 - Added diagnostics for 'pos' keyword errors and duplicate entries; enhanced remote field checks; improved deduplication checks; retained Google Careers parsing and dropdown diagnostics.
-# - 2025-08-07: Version 1.17 - Enhanced diagnostics for limited data and invalid job positions; improved remote field type checks; refined non-English skip and location validation; retained deduplication and parsing diagnostics.
-# - 2025-08-07: Version 1.18 - Added diagnostics for JavaScript rendering issues and IndentationError; enhanced remote field and parsing diagnostics; retained non-English skip and location validation.
+# - 2026-10-15: Version 1.38 - Held parsed_jobs_output.txt and .html entries in a slotted JobEntry dataclass instead of dicts.
+# - 2026-10-15: Version 1.39 - Scanned combined_reports.txt, parse_errors_report.txt and parsed_jobs_output.txt in binary mode, decoding only flagged sections, flagged lines and kept field values.
+# - 2026-10-15: Version 1.40 - Split the per-file checks into functions run on a thread pool, merging their findings in file order before the HTML cross-check; dropped the unused errors list.
+# - 2026-10-15: Version 1.41 - Opened each input directly and reported missing files from FileNotFoundError instead of checking os.path.exists first; sized combined_reports.txt with os.fstat on the open file.
+# - 2026-10-15: Version 1.42 - Split combined_reports.txt at a report header anywhere in a line, as the original whole-file split did, instead of only at the start of a line.
 import os
 import re
+import mmap
+import codecs
+import contextlib
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from html.parser import HTMLParser
 import json
 from datetime import datetime
 import logging
+try:
+    import orjson  # Optional: faster parsing of rats_data.json; stdlib json is used when unavailable
+except ImportError:
+    orjson = None
 
 # Set up logging
-LOG_DIR = os.path.join(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')), 'logs')
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+LOG_DIR = os.path.join(ROOT_DIR, 'logs')
 os.makedirs(LOG_DIR, exist_ok=True)
 logging.basicConfig(filename=os.path.join(LOG_DIR, 'error_recovery.log'), level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s', filemode='w')
 
-def analyze_errors():
-    try:
-        report_path = os.path.join(LOG_DIR, 'parse_errors_report.txt')
-        json_path = os.path.join(os.path.dirname(LOG_DIR), 'data', 'rats_data.json')
-        txt_path = os.path.join(os.path.dirname(LOG_DIR), 'data', 'parsed_jobs_output.txt')
-        html_path = os.path.join(os.path.dirname(LOG_DIR), 'data', 'parsed_jobs_output.html')
-        combined_reports_path = os.path.join(LOG_DIR, 'combined_reports.txt')
-        output_path = os.path.join(LOG_DIR, 'error_recovery_report.txt')
-        errors = []
-        recovery_suggestions = []
-        seen_keys = set()
+# Input and output paths (resolved once at import)
+DATA_DIR = os.path.join(ROOT_DIR, 'data')
+EMAIL_DUMPS_DIR = os.path.join(DATA_DIR, 'email_dumps')
+REPORT_PATH = os.path.join(LOG_DIR, 'parse_errors_report.txt')
+JSON_PATH = os.path.join(DATA_DIR, 'rats_data.json')
+TXT_PATH = os.path.join(DATA_DIR, 'parsed_jobs_output.txt')
+HTML_PATH = os.path.join(DATA_DIR, 'parsed_jobs_output.html')
+COMBINED_REPORTS_PATH = os.path.join(LOG_DIR, 'combined_reports.txt')
+OUTPUT_PATH = os.path.join(LOG_DIR, 'error_recovery_report.txt')
 
-        # Analyze combined_reports.txt
-        if os.path.exists(combined_reports_path):
-            file_size = os.path.getsize(combined_reports_path) / (1024 * 1024)  # Size in MB
-            if file_size > 10:
-                recovery_suggestions.append(f"WARNING: combined_reports.txt is large ({file_size:.2f} MB).\n  Recovery: Split file into sections for analysis or upload directly to Grok interface.")
-            with open(combined_reports_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                sections = re.split(r'--- Report File: .+? ---', content)
-                for section in sections[1:]:
-                    section = section.strip()
-                    if not section:
-                        continue
-                    if re.search(r'ERROR|WARNING', section):
-                        errors.append(section[:100] + '...')
-                        if 'JSON initialization error' in section:
-                            recovery_suggestions.append(f"Found in combined_reports.txt: JSON initialization error\n  Recovery: Verify data/rats_data.json exists and is valid JSON. Check file permissions and OneDrive sync status.")
-                        elif 'JSON serialization error' in section:
-                            recovery_suggestions.append(f"Found in combined_reports.txt: JSON serialization error\n  Recovery: Validate rats_data.json for syntax errors (e.g., unescaped characters, missing commas). Ensure data entries are properly formatted.")
-                        elif 'Error saving to JSON' in section:
-                            recovery_suggestions.append(f"Found in combined_reports.txt: Error saving to JSON\n  Recovery: Ensure write permissions for data/rats_data.json. Check for OneDrive file locking.")
-                        elif 'Error generating output files' in section:
-                            recovery_suggestions.append(f"Found in combined_reports.txt: Error generating output files\n  Recovery: Validate JSON data in rats_data.json. Check write permissions for output files. Verify HTML rendering in parsed_jobs_output.html.")
-                        elif 'No source identified' in section:
-                            recovery_suggestions.append(f"Found in combined_reports.txt: No source identified\n  Recovery: Review email dump content for missing copyright footer or sender email. Update SOURCES/SENDER_PATTERNS in process_email_dumps.py.")
-                        elif 'Error parsing' in section:
-                            recovery_suggestions.append(f"Found in combined_reports.txt: Error parsing\n  Recovery: Inspect email dump for malformed content. Adjust regex patterns in parse_email function.")
-                        elif 'No job postings identified' in section and 'GoogleCareers' in section:
-                            recovery_suggestions.append(f"Found in combined_reports.txt: No job postings for GoogleCareers\n  Recovery: Review GoogleCareers email dump for job posting format. Update position_pattern, location_pattern, and qualifications_pattern in parse_email function.")
-                        elif 'Non-English position skipped' in section:
-                            recovery_suggestions.append(f"Found in combined_reports.txt: Non-English position skipped\n  Recovery: Review skipped lines for valid job titles with special characters (e.g., 'MarTech'). Adjust English-only filter in parse_email to allow valid titles.")
-                        elif 'unterminated string literal' in section or 'f-string' in section:
-                            recovery_suggestions.append(f"Found in combined_reports.txt: Syntax error in f-string\n  Recovery: Check HTML output section in process_email_dumps.py for unclosed f-string literals or improper escaping.")
-                        elif 'Failed to parse job data' in section or 'Failed to process job data' in section:
-                            recovery_suggestions.append(f"Found in combined_reports.txt: JavaScript error\n  Recovery: Validate embedded JSON and JavaScript syntax in generate_output function of process_email_dumps.py.")
-                        elif 'Error processing' in section:
-                            recovery_suggestions.append(f"Found in combined_reports.txt: Error processing file\n  Recovery: Check file access permissions for email dumps in data/email_dumps/. Verify parse_email function for robust error handling.")
-                        elif 'pos' in section:
-                            recovery_suggestions.append(f"Found in combined_reports.txt: 'pos' keyword error\n  Recovery: Remove invalid 'pos' and 'endpos' arguments from re.search in parse_email function.")
-                        elif 'IndentationError' in section:
-                            recovery_suggestions.append(f"Found in combined_reports.txt: IndentationError\n  Recovery: Check process_email_dumps.py for incorrect indentation in HTML output block.")
-                        else:
-                            recovery_suggestions.append(f"Found in combined_reports.txt: {section[:100]}...\n  Recovery: Manual review required. Check email dump content and script logic.")
-        else:
-            recovery_suggestions.append("WARNING: combined_reports.txt not found.\n  Recovery: Run combine_report_files.py to generate the combined report.")
+# Precompiled patterns (compiled once at import instead of per line/entry)
+SECTION_RE = re.compile(rb'--- Report File: .+? ---')
+TIME_RE = re.compile(r'\d{1,2}:\d{2}\s*(?:AM|PM)', re.IGNORECASE)
 
-        # Analyze parse_errors_report.txt
-        if os.path.exists(report_path):
-            with open(report_path, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
-                for line in lines:
-                    if re.search(r'ERROR|WARNING', line):
-                        errors.append(line.strip())
-                        if 'JSON initialization error' in line:
-                            recovery_suggestions.append(f"{line}\n  Recovery: Verify data/rats_data.json exists and is valid JSON. Check file permissions and OneDrive sync status.")
-                        elif 'JSON serialization error' in line:
-                            recovery_suggestions.append(f"{line}\n  Recovery: Validate rats_data.json for syntax errors (e.g., unescaped characters, missing commas). Ensure data entries are properly formatted.")
-                        elif 'Error saving to JSON' in line:
-                            recovery_suggestions.append(f"{line}\n  Recovery: Ensure write permissions for data/rats_data.json. Check for OneDrive file locking.")
-                        elif 'Error generating output files' in line:
-                            recovery_suggestions.append(f"{line}\n  Recovery: Validate JSON data in rats_data.json. Check write permissions for output files. Verify HTML rendering in parsed_jobs_output.html.")
-                        elif 'No source identified' in line:
-                            recovery_suggestions.append(f"{line}\n  Recovery: Review email dump content for missing copyright footer or sender email. Update SOURCES/SENDER_PATTERNS in process_email_dumps.py.")
-                        elif 'Error parsing' in line:
-                            recovery_suggestions.append(f"{line}\n  Recovery: Inspect email dump for malformed content. Adjust regex patterns in parse_email function.")
-                        elif 'No job postings identified' in line and 'GoogleCareers' in line:
-                            recovery_suggestions.append(f"{line}\n  Recovery: Review GoogleCareers email dump for job posting format. Update position_pattern, location_pattern, and qualifications_pattern in parse_email function.")
-                        elif 'Non-English position skipped' in line:
-                            recovery_suggestions.append(f"{line}\n  Recovery: Review skipped lines for valid job titles with special characters (e.g., 'MarTech'). Adjust English-only filter in parse_email to allow valid titles.")
-                        elif 'unterminated string literal' in line or 'f-string' in line:
-                            recovery_suggestions.append(f"{line}\n  Recovery: Check HTML output section in process_email_dumps.py for unclosed f-string literals or improper escaping.")
-                        elif 'Failed to parse job data' in line or 'Failed to process job data' in line:
-                            recovery_suggestions.append(f"{line}\n  Recovery: Validate embedded JSON and JavaScript syntax in generate_output function of process_email_dumps.py.")
-                        elif 'Error processing' in line:
-                            recovery_suggestions.append(f"{line}\n  Recovery: Check file access permissions for email dumps in data/email_dumps/. Verify parse_email function for robust error handling.")
-                        elif 'IndentationError' in line:
-                            recovery_suggestions.append(f"{line}\n  Recovery: Check process_email_dumps.py for incorrect indentation in HTML output block.")
-                        else:
-                            recovery_suggestions.append(f"{line}\n  Recovery: Manual review required. Check email dump content and script logic.")
-        else:
-            recovery_suggestions.append("WARNING: parse_errors_report.txt not found.\n  Recovery: Run process_email_dumps.py to generate the report.")
+# Fields every rats_data.json entry must carry
+REQUIRED_FIELDS = ('filename', 'source', 'sender', 'job_position', 'location', 'minimum_qualifications', 'remote')
+MISSING = object()
+# Fields compared between rats_data.json and parsed_jobs_output.html
+CROSS_CHECK_FIELDS = ('source', 'job_position', 'location', 'minimum_qualifications', 'remote')
+
+# Recovery rules checked in order (first match wins): (label, any-of triggers, also-required triggers, recovery)
+RECOVERY_RULES = [
+    ("JSON initialization error", ('JSON initialization error',), (), "Verify data/rats_data.json exists and is valid JSON. Check file permissions and OneDrive sync status."),
+    ("JSON serialization error", ('JSON serialization error',), (), "Validate rats_data.json for syntax errors (e.g., unescaped characters, missing commas). Ensure data entries are properly formatted."),
+    ("Error saving to JSON", ('Error saving to JSON',), (), "Ensure write permissions for data/rats_data.json. Check for OneDrive file locking."),
+    ("Error generating output files", ('Error generating output files',), (), "Validate JSON data in rats_data.json. Check write permissions for output files. Verify HTML rendering in parsed_jobs_output.html."),
+    ("No source identified", ('No source identified',), (), "Review email dump content for missing copyright footer or sender email. Update SOURCES/SENDER_PATTERNS in process_email_dumps.py."),
+    ("Error parsing", ('Error parsing',), (), "Inspect email dump for malformed content. Adjust regex patterns in parse_email function."),
+    ("No job postings for GoogleCareers", ('No job postings identified',), ('GoogleCareers',), "Review GoogleCareers email dump for job posting format. Update position_pattern, location_pattern, and qualifications_pattern in parse_email function."),
+    ("Non-English position skipped", ('Non-English position skipped',), (), "Review skipped lines for valid job titles with special characters (e.g., 'MarTech'). Adjust English-only filter in parse_email to allow valid titles."),
+    ("Syntax error in f-string", ('unterminated string literal', 'f-string'), (), "Check HTML output section in process_email_dumps.py for unclosed f-string literals or improper escaping."),
+    ("JavaScript error", ('Failed to parse job data', 'Failed to process job data'), (), "Validate embedded JSON and JavaScript syntax in generate_output function of process_email_dumps.py."),
+    ("Error processing file", ('Error processing',), (), "Check file access permissions for email dumps in data/email_dumps/. Verify parse_email function for robust error handling."),
+    ("'pos' keyword error", ('pos',), (), "Remove invalid 'pos' and 'endpos' arguments from re.search in parse_email function."),
+    ("IndentationError", ('IndentationError',), (), "Check process_email_dumps.py for incorrect indentation in HTML output block."),
+]
+# Single report lines skip the 'pos' rule (it would match any line mentioning 'postings')
+LINE_RECOVERY_RULES = [rule for rule in RECOVERY_RULES if rule[0] != "'pos' keyword error"]
+MANUAL_REVIEW = "Manual review required. Check email dump content and script logic."
+
+# Hash of the fields that identify a rats_data.json entry; only the int is kept in the seen_keys sets (collisions are acceptable for an advisory check)
+def dedup_key(entry):
+    return hash((entry.get('source', ''), entry.get('job_position', ''), entry.get('location', ''), entry.get('minimum_qualifications', '')))
+
+# Job entry read back from parsed_jobs_output.txt or parsed_jobs_output.html
+@dataclass(slots=True)
+class JobEntry:
+    source: str = ''
+    job_position: str = ''
+    location: str = ''
+    minimum_qualifications: str = ''
+    remote: bool = False
+
+    # Same fields and hashing as dedup_key
+    def dedup_key(self):
+        return hash((self.source, self.job_position, self.location, self.minimum_qualifications))
+
+# Map a file read-only (empty files cannot be mapped)
+def map_file(f):
+    if os.fstat(f.fileno()).st_size == 0:
+        return contextlib.nullcontext(b'')
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+# Collect the <td> cell texts of each table row; <br> becomes a newline and entity references are kept as written
+class TableRowParser(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.rows = []
+        self.cells = None
+        self.cell = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'tr':
+            self.cells = []
+        elif tag == 'td' and not attrs and self.cells is not None:
+            self.cell = []
+        elif tag == 'br' and self.cell is not None:
+            self.cell.append('\n')
+
+    def handle_endtag(self, tag):
+        if tag == 'td' and self.cell is not None:
+            self.cells.append(''.join(self.cell))
+            self.cell = None
+        elif tag == 'tr' and self.cells is not None:
+            self.rows.append(self.cells)
+            self.cells = None
+
+    def handle_data(self, data):
+        if self.cell is not None:
+            self.cell.append(data)
+
+    def handle_entityref(self, name):
+        self.handle_data(f'&{name};')
+
+    def handle_charref(self, name):
+        self.handle_data(f'&#{name};')
+
+# Classify an error/warning text against the recovery rules
+def classify_error(text, rules=RECOVERY_RULES):
+    for label, triggers, required, recovery in rules:
+        if any(t in text for t in triggers) and all(r in text for r in required):
+            return label, recovery
+    return None, MANUAL_REVIEW
+
+# Decode bytes read in binary mode as text mode would (UTF-8, universal newlines)
+def decode_text(data, errors='strict'):
+    return data.decode('utf-8', errors).replace('\r\n', '\n').replace('\r', '\n')
 
-        # Analyze rats_data.json
-        json_data = []
-        json_entry_count = 0
-        google_careers_count = 0
-        glassdoor_count = 0
-        seen_keys = set()
-        if os.path.exists(json_path):
-            try:
-                with open(json_path, 'r', encoding='utf-8') as f:
-                    json_data = json.load(f)
-                if not json_data:
-                    recovery_suggestions.append("ERROR: rats_data.json is empty.\n  Recovery: Check email dump processing in process_email_dumps.py. Ensure email_dumps/ contains valid .txt files.")
-                for entry in json_data:
-                    json_entry_count += 1
-                    if not isinstance(entry, dict):
-                        recovery_suggestions.append(f"ERROR: Invalid entry in rats_data.json: {entry}\n  Recovery: Ensure all entries are valid dictionaries.")
-                        continue
-                    required_fields = ['filename', 'source', 'sender', 'job_position', 'location', 'minimum_qualifications', 'remote']
-                    for field in required_fields:
-                        if field not in entry:
-                            recovery_suggestions.append(f"ERROR: Missing field {field} in rats_data.json for {entry.get('filename', 'unknown file')}\n  Recovery: Review email dump {entry.get('filename', 'unknown file')} for missing data. Update parse_email function.")
-                        elif field == 'remote' and not isinstance(entry[field], bool):
-                            recovery_suggestions.append(f"ERROR: Invalid 'remote' field type in rats_data.json for {entry.get('filename', 'unknown file')}: {entry[field]}\n  Recovery: Ensure parse_email function sets 'remote' as boolean.")
-                        elif entry[field] == 'Unknown':
-                            recovery_suggestions.append(f"WARNING: 'Unknown' {field} in rats_data.json for {entry.get('filename', 'unknown file')}\n  Recovery: Review email dump {entry.get('filename', 'unknown file')} for missing data. Update parse_email function.")
-                        elif field == 'job_position' and re.search(r'[^\x00-\x7F]', entry[field]):
-                            recovery_suggestions.append(f"WARNING: Non-English job position in rats_data.json for {entry.get('filename', 'unknown file')}: {entry[field]}\n  Recovery: Enhance English-only filter in parse_email function.")
-                        elif field == 'location' and re.search(r'\d{1,2}:\d{2}\s*(?:AM|PM)', entry[field], re.IGNORECASE):
-                            recovery_suggestions.append(f"WARNING: Invalid location in rats_data.json for {entry.get('filename', 'unknown file')}: {entry[field]}\n  Recovery: Exclude timestamps from location parsing in parse_email function.")
-                    key = (entry.get('source', ''), entry.get('job_position', ''), entry.get('location', ''), entry.get('minimum_qualifications', ''))
-                    if key in seen_keys:
-                        recovery_suggestions.append(f"WARNING: Duplicate entry in rats_data.json for {entry.get('filename', 'unknown file')} with source {entry.get('source', '')} and job {entry.get('job_position', '')}\n  Recovery: Review parse_email function for duplicate job posting extraction.")
-                    seen_keys.add(key)
-                    if entry.get('source') == 'GoogleCareers':
-                        google_careers_count += 1
-                    if entry.get('source') == 'Glassdoor':
-                        glassdoor_count += 1
-                email_dumps_dir = os.path.join(os.path.dirname(json_path), 'email_dumps')
-                google_careers_files = len([f for f in os.listdir(email_dumps_dir) if 'GoogleCareers' in f])
-                glassdoor_files = len([f for f in os.listdir(email_dumps_dir) if 'glassdoor_email' in f])
-                if json_entry_count < 50 and (google_careers_files > 0 or glassdoor_files > 0):
-                    recovery_suggestions.append(f"WARNING: Limited entries ({json_entry_count}) in rats_data.json despite available email dumps.\n  Recovery: Review parse_email function for incomplete section parsing.")
-                if google_careers_count < glassdoor_count and google_careers_files >= glassdoor_files:
-                    recovery_suggestions.append(f"WARNING: Fewer GoogleCareers entries ({google_careers_count}) than Glassdoor ({glassdoor_count}) in rats_data.json despite similar input volumes.\n  Recovery: Review GoogleCareers email dumps for missing job postings. Update position_pattern, location_pattern, and qualifications_pattern in parse_email function.")
-                if glassdoor_count > 0 and glassdoor_files == 1:
-                    logging.info("Detected combined Glassdoor file (glassdoor_email_1.txt).")
-                elif glassdoor_count > 0 and glassdoor_files > 1:
-                    recovery_suggestions.append("WARNING: Multiple Glassdoor files detected in email_dumps/. Run combine_glassdoor_emails.py to merge into glassdoor_email_1.txt.")
-            except json.JSONDecodeError as e:
-                recovery_suggestions.append(f"ERROR: Invalid JSON in rats_data.json: {e}\n  Recovery: Validate JSON syntax. Check for unescaped characters or incomplete entries.")
-            except Exception as e:
-                recovery_suggestions.append(f"ERROR: Failed to read rats_data.json: {e}\n  Recovery: Verify file accessibility and OneDrive sync status.")
+# Analyze one raw report section (only sections mentioning ERROR/WARNING are decoded); findings are prefixed with the report name
+def analyze_report_section(section, recovery_suggestions, source_label='combined_reports.txt'):
+    if b'ERROR' in section or b'WARNING' in section:
+        section = decode_text(section, 'ignore').strip()
+        label, recovery = classify_error(section)
+        if label:
+            recovery_suggestions[f"Found in {source_label}: {label}\n  Recovery: {recovery}"] += 1
         else:
-            recovery_suggestions.append("ERROR: rats_data.json not found.\n  Recovery: Run process_email_dumps.py to generate the file.")
+            recovery_suggestions[f"Found in {source_label}: {section[:100]}...\n  Recovery: {recovery}"] += 1
 
-        # Analyze parsed_jobs_output.txt
-        txt_entries = []
-        seen_keys = set()
-        if os.path.exists(txt_path):
-            with open(txt_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                current_entry = {}
-                for line in lines:
-                    if line.startswith('Source:'):
-                        if current_entry:
-                            txt_entries.append(current_entry)
-                        current_entry = {'source': line.split('Source: ')[1].strip()}
-                    elif line.startswith('Job Position:'):
-                        current_entry['job_position'] = line.split('Job Position: ')[1].strip()
-                    elif line.startswith('Location:'):
-                        current_entry['location'] = line.split('Location: ')[1].strip()
-                    elif line.startswith('Min Requirements:'):
-                        current_entry['minimum_qualifications'] = line.split('Min Requirements: ')[1].strip()
-                    elif line.startswith('Remote:'):
-                        current_entry['remote'] = line.split('Remote: ')[1].strip() == 'Yes'
-                    if 'Unknown' in line and not line.startswith('---'):
-                        recovery_suggestions.append(f"WARNING: 'Unknown' value in parsed_jobs_output.txt for {current_entry.get('source', 'unknown source')}: {line.strip()}\n  Recovery: Cross-check with rats_data.json. Update parse_email function to handle missing data.")
-                    if 'job_position' in current_entry and re.search(r'[^\x00-\x7F]', current_entry['job_position']):
-                        recovery_suggestions.append(f"WARNING: Non-English job position in parsed_jobs_output.txt for {current_entry.get('source', 'unknown source')}: {current_entry['job_position']}\n  Recovery: Enhance English-only filter in parse_email function.")
-                    if 'location' in current_entry and re.search(r'\d{1,2}:\d{2}\s*(?:AM|PM)', current_entry['location'], re.IGNORECASE):
-                        recovery_suggestions.append(f"WARNING: Invalid location in parsed_jobs_output.txt for {current_entry.get('source', 'unknown source')}: {current_entry['location']}\n  Recovery: Exclude timestamps from location parsing in parse_email function.")
-                if current_entry:
+# Analyze combined_reports.txt
+def analyze_combined_reports():
+    recovery_suggestions = Counter()
+    try:
+        f = open(COMBINED_REPORTS_PATH, 'rb')
+    except FileNotFoundError:
+        recovery_suggestions["WARNING: combined_reports.txt not found.\n  Recovery: Run combine_report_files.py to generate the combined report."] += 1
+        return recovery_suggestions
+    with f:
+        file_size = os.fstat(f.fileno()).st_size / (1024 * 1024)  # Size in MB
+        if file_size > 10:
+            recovery_suggestions[f"WARNING: combined_reports.txt is large ({file_size:.2f} MB).\n  Recovery: Split file into sections for analysis or upload directly to Grok interface."] += 1
+        # Stream line by line, holding only the current section in memory
+        section_lines = None  # Text before the first section header is ignored
+        for line in f:
+            # A header can appear anywhere in a line; the text before it still belongs to the previous section
+            start = 0
+            if b'--- Report File:' in line:
+                for match in SECTION_RE.finditer(line):
+                    if section_lines is not None:
+                        section_lines.append(line[start:match.start()])
+                        analyze_report_section(b''.join(section_lines), recovery_suggestions)
+                    section_lines = []
+                    start = match.end()
+            if section_lines is not None:
+                section_lines.append(line[start:])
+        if section_lines is not None:
+            analyze_report_section(b''.join(section_lines), recovery_suggestions)
+    return recovery_suggestions
+
+# Analyze parse_errors_report.txt
+def analyze_parse_errors_report():
+    recovery_suggestions = Counter()
+    try:
+        f = open(REPORT_PATH, 'rb')
+    except FileNotFoundError:
+        recovery_suggestions["WARNING: parse_errors_report.txt not found.\n  Recovery: Run process_email_dumps.py to generate the report."] += 1
+        return recovery_suggestions
+    with f:
+        for line in f:
+            if b'ERROR' in line or b'WARNING' in line:
+                line = decode_text(line, 'ignore')
+                label, recovery = classify_error(line, LINE_RECOVERY_RULES)
+                recovery_suggestions[f"{line}\n  Recovery: {recovery}"] += 1
+    return recovery_suggestions
+
+# Analyze rats_data.json; also returns the cross-check records and GoogleCareers entry count
+def analyze_json():
+    recovery_suggestions = Counter()
+    json_records = []  # Cross-check fields of each rats_data.json entry
+    json_entry_count = 0
+    google_careers_count = 0
+    glassdoor_count = 0
+    seen_keys_json = set()
+    try:
+        f = open(JSON_PATH, 'rb')
+    except FileNotFoundError:
+        recovery_suggestions["ERROR: rats_data.json not found.\n  Recovery: Run process_email_dumps.py to generate the file."] += 1
+        return recovery_suggestions, json_records, google_careers_count
+    try:
+        with f:
+            json_data = orjson.loads(f.read()) if orjson else json.loads(f.read())
+        if not json_data:
+            recovery_suggestions["ERROR: rats_data.json is empty.\n  Recovery: Check email dump processing in process_email_dumps.py. Ensure email_dumps/ contains valid .txt files."] += 1
+        for entry in json_data:
+            json_entry_count += 1
+            if not isinstance(entry, dict):
+                recovery_suggestions[f"ERROR: Invalid entry in rats_data.json: {entry}\n  Recovery: Ensure all entries are valid dictionaries."] += 1
+                continue
+            fname = entry.get('filename', 'unknown file')
+            for field in REQUIRED_FIELDS:
+                value = entry.get(field, MISSING)
+                if value is MISSING:
+                    recovery_suggestions[f"ERROR: Missing field {field} in rats_data.json for {fname}\n  Recovery: Review email dump {fname} for missing data. Update parse_email function."] += 1
+                elif field == 'remote' and not isinstance(value, bool):
+                    recovery_suggestions[f"ERROR: Invalid 'remote' field type in rats_data.json for {fname}: {value}\n  Recovery: Ensure parse_email function sets 'remote' as boolean."] += 1
+                elif value == 'Unknown':
+                    recovery_suggestions[f"WARNING: 'Unknown' {field} in rats_data.json for {fname}\n  Recovery: Review email dump {fname} for missing data. Update parse_email function."] += 1
+                elif field == 'job_position' and not value.isascii():
+                    recovery_suggestions[f"WARNING: Non-English job position in rats_data.json for {fname}: {value}\n  Recovery: Enhance English-only filter in parse_email function."] += 1
+                elif field == 'location' and ':' in value and TIME_RE.search(value):
+                    recovery_suggestions[f"WARNING: Invalid location in rats_data.json for {fname}: {value}\n  Recovery: Exclude timestamps from location parsing in parse_email function."] += 1
+            key = dedup_key(entry)
+            seen_count = len(seen_keys_json)
+            seen_keys_json.add(key)
+            if len(seen_keys_json) == seen_count:
+                recovery_suggestions[f"WARNING: Duplicate entry in rats_data.json for {fname} with source {entry.get('source', '')} and job {entry.get('job_position', '')}\n  Recovery: Review parse_email function for duplicate job posting extraction."] += 1
+            if entry.get('source') == 'GoogleCareers':
+                google_careers_count += 1
+            if entry.get('source') == 'Glassdoor':
+                glassdoor_count += 1
+            json_records.append({field: entry[field] for field in CROSS_CHECK_FIELDS if field in entry})
+        del json_data  # Release full entries (including email content) before the txt/html passes
+        google_careers_files = glassdoor_files = 0
+        with os.scandir(EMAIL_DUMPS_DIR) as it:
+            for dump in it:
+                if 'GoogleCareers' in dump.name:
+                    google_careers_files += 1
+                if 'glassdoor_email' in dump.name:
+                    glassdoor_files += 1
+        if json_entry_count < 50 and (google_careers_files > 0 or glassdoor_files > 0):
+            recovery_suggestions[f"WARNING: Limited entries ({json_entry_count}) in rats_data.json despite available email dumps.\n  Recovery: Review parse_email function for incomplete section parsing."] += 1
+        if google_careers_count < glassdoor_count and google_careers_files >= glassdoor_files:
+            recovery_suggestions[f"WARNING: Fewer GoogleCareers entries ({google_careers_count}) than Glassdoor ({glassdoor_count}) in rats_data.json despite similar input volumes.\n  Recovery: Review GoogleCareers email dumps for missing job postings. Update position_pattern, location_pattern, and qualifications_pattern in parse_email function."] += 1
+        if glassdoor_count > 0 and glassdoor_files == 1:
+            logging.info("Detected combined Glassdoor file (glassdoor_email_1.txt).")
+        elif glassdoor_count > 0 and glassdoor_files > 1:
+            recovery_suggestions["WARNING: Multiple Glassdoor files detected in email_dumps/. Run combine_glassdoor_emails.py to merge into glassdoor_email_1.txt."] += 1
+    except json.JSONDecodeError as e:
+        recovery_suggestions[f"ERROR: Invalid JSON in rats_data.json: {e}\n  Recovery: Validate JSON syntax. Check for unescaped characters or incomplete entries."] += 1
+    except Exception as e:
+        recovery_suggestions[f"ERROR: Failed to read rats_data.json: {e}\n  Recovery: Verify file accessibility and OneDrive sync status."] += 1
+    return recovery_suggestions, json_records, google_careers_count
+
+# Analyze parsed_jobs_output.txt; also returns the number of entries
+def analyze_txt():
+    recovery_suggestions = Counter()
+    txt_entries = []
+    seen_keys_txt = set()
+    try:
+        f = open(TXT_PATH, 'rb')
+    except FileNotFoundError:
+        recovery_suggestions["ERROR: parsed_jobs_output.txt not found.\n  Recovery: Run process_email_dumps.py to generate the file."] += 1
+        return recovery_suggestions, len(txt_entries)
+    with f:
+        current_entry = None
+        for line in f:
+            if line.startswith(b'Source:'):
+                if current_entry is not None:
                     txt_entries.append(current_entry)
-                if not txt_entries:
-                    recovery_suggestions.append("ERROR: No entries found in parsed_jobs_output.txt.\n  Recovery: Verify rats_data.json contains data. Check generate_output function in process_email_dumps.py.")
-                for entry in txt_entries:
-                    key = (entry.get('source', ''), entry.get('job_position', ''), entry.get('location', ''), entry.get('minimum_qualifications', ''))
-                    if key in seen_keys:
-                        recovery_suggestions.append(f"WARNING: Duplicate entry in parsed_jobs_output.txt for source {entry.get('source', '')} and job {entry.get('job_position', '')}\n  Recovery: Review parse_email function for duplicate job posting extraction.")
-                    seen_keys.add(key)
-                if len(txt_entries) < 50:
-                    recovery_suggestions.append(f"WARNING: Limited entries ({len(txt_entries)}) in parsed_jobs_output.txt.\n  Recovery: Verify parse_email function for incomplete job posting extraction.")
-        else:
-            recovery_suggestions.append("ERROR: parsed_jobs_output.txt not found.\n  Recovery: Run process_email_dumps.py to generate the file.")
+                current_entry = JobEntry(source=line[len(b'Source:'):].decode('utf-8').strip())
+            elif current_entry is None:
+                continue  # Report header before the first entry
+            elif line.startswith(b'Job Position:'):
+                current_entry.job_position = line[len(b'Job Position:'):].decode('utf-8').strip()
+                if not current_entry.job_position.isascii():
+                    recovery_suggestions[f"WARNING: Non-English job position in parsed_jobs_output.txt for {current_entry.source}: {current_entry.job_position}\n  Recovery: Enhance English-only filter in parse_email function."] += 1
+            elif line.startswith(b'Location:'):
+                current_entry.location = line[len(b'Location:'):].decode('utf-8').strip()
+                if ':' in current_entry.location and TIME_RE.search(current_entry.location):
+                    recovery_suggestions[f"WARNING: Invalid location in parsed_jobs_output.txt for {current_entry.source}: {current_entry.location}\n  Recovery: Exclude timestamps from location parsing in parse_email function."] += 1
+            elif line.startswith(b'Min Requirements:'):
+                current_entry.minimum_qualifications = line[len(b'Min Requirements:'):].decode('utf-8').strip()
+            elif line.startswith(b'Remote:'):
+                current_entry.remote = line[len(b'Remote:'):].strip() == b'Yes'
+            if b'Unknown' in line and not line.startswith(b'---'):
+                recovery_suggestions[f"WARNING: 'Unknown' value in parsed_jobs_output.txt for {current_entry.source}: {line.decode('utf-8').strip()}\n  Recovery: Cross-check with rats_data.json. Update parse_email function to handle missing data."] += 1
+        if current_entry is not None:
+            txt_entries.append(current_entry)
+        if not txt_entries:
+            recovery_suggestions["ERROR: No entries found in parsed_jobs_output.txt.\n  Recovery: Verify rats_data.json contains data. Check generate_output function in process_email_dumps.py."] += 1
+        for entry in txt_entries:
+            key = entry.dedup_key()
+            seen_count = len(seen_keys_txt)
+            seen_keys_txt.add(key)
+            if len(seen_keys_txt) == seen_count:
+                recovery_suggestions[f"WARNING: Duplicate entry in parsed_jobs_output.txt for source {entry.source} and job {entry.job_position}\n  Recovery: Review parse_email function for duplicate job posting extraction."] += 1
+        if len(txt_entries) < 50:
+            recovery_suggestions[f"WARNING: Limited entries ({len(txt_entries)}) in parsed_jobs_output.txt.\n  Recovery: Verify parse_email function for incomplete job posting extraction."] += 1
+    return recovery_suggestions, len(txt_entries)
 
-        # Analyze parsed_jobs_output.html
-        html_entries = []
-        seen_keys = set()
-        if os.path.exists(html_path):
-            with open(html_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
-                if '<div class="dropdown-content" id="sourceFilter">' not in html_content:
-                    recovery_suggestions.append("ERROR: Source dropdown filter missing in parsed_jobs_output.html.\n  Recovery: Verify generate_output function in process_email_dumps.py for correct dropdown HTML.")
-                if '<div class="dropdown-content" id="remoteFilter">' not in html_content:
-                    recovery_suggestions.append("ERROR: Remote dropdown filter missing in parsed_jobs_output.html.\n  Recovery: Verify generate_output function in process_email_dumps.py for correct dropdown HTML.")
-                if '<div class="dropdown-content" id="fileFilter">' in html_content:
-                    recovery_suggestions.append("WARNING: Redundant File dropdown found in parsed_jobs_output.html.\n  Recovery: Remove File dropdown from generate_output function as only one file per source is used.")
-                if 'Generated by process_email_dumps.py version 7.26' not in html_content:
-                    recovery_suggestions.append("WARNING: Incorrect or missing footer note in parsed_jobs_output.html.\n  Recovery: Update footer note in generate_output function.")
-                if 'Failed to parse job data' in html_content or 'Failed to process job data' in html_content:
-                    recovery_suggestions.append("ERROR: JavaScript errors in parsed_jobs_output.html.\n  Recovery: Validate embedded JSON and JavaScript syntax in generate_output function of process_email_dumps.py.")
-                tbody_start = html_content.find('<tbody>')
-                tbody_end = html_content.find('</tbody>')
-                if tbody_start != -1 and tbody_end != -1:
-                    tbody_content = html_content[tbody_start + 7:tbody_end]
-                    rows = tbody_content.split('<tr')
-                    for row in rows[1:]:
-                        cols = row.split('<td>')
-                        if len(cols) >= 6:
-                            entry = {
-                                'source': cols[1].split('</td>')[0].strip().split(' (')[0],
-                                'job_position': cols[2].split('</td>')[0].strip(),
-                                'location': cols[3].split('</td>')[0].strip(),
-                                'minimum_qualifications': cols[4].split('</td>')[0].replace('<br>', '\n').strip(),
-                                'remote': cols[5].split('</td>')[0].strip() == 'Yes'
-                            }
-                            html_entries.append(entry)
-                            key = (entry['source'], entry['job_position'], entry['location'], entry['minimum_qualifications'])
-                            if key in seen_keys:
-                                recovery_suggestions.append(f"WARNING: Duplicate entry in parsed_jobs_output.html for source {entry['source']} and job {entry['job_position']}\n  Recovery: Review parse_email function for duplicate job posting extraction.")
-                            seen_keys.add(key)
-                if not html_entries:
-                    recovery_suggestions.append("ERROR: No entries found in parsed_jobs_output.html.\n  Recovery: Verify rats_data.json contains data. Check generate_output function for HTML table generation.")
-                else:
-                    if len(html_entries) < len(txt_entries):
-                        recovery_suggestions.append(f"WARNING: Fewer entries ({len(html_entries)}) in parsed_jobs_output.html than in parsed_jobs_output.txt ({len(txt_entries)}).\n  Recovery: Verify generate_output function for complete HTML table generation.")
-                    for json_entry in json_data:
-                        if 'source' in json_entry:
-                            matching_html = [e for e in html_entries if e['source'] == json_entry['source'] and e['job_position'] == json_entry['job_position']]
-                            if not matching_html:
-                                recovery_suggestions.append(f"WARNING: Source {json_entry['source']} with job {json_entry['job_position']} in rats_data.json not found in parsed_jobs_output.html.\n  Recovery: Verify static table generation in process_email_dumps.py.")
-                            else:
-                                for field in ['source', 'job_position', 'location', 'minimum_qualifications', 'remote']:
-                                    if field in json_entry and json_entry[field] != matching_html[0][field]:
-                                        recovery_suggestions.append(f"WARNING: Mismatch in {field} for {json_entry['source']} with job {json_entry['job_position']} between rats_data.json and parsed_jobs_output.html.\n  Recovery: Verify data consistency in generate_output function.")
-                    if len(html_entries) < 50:
-                        recovery_suggestions.append(f"WARNING: Limited entries ({len(html_entries)}) in parsed_jobs_output.html.\n  Recovery: Verify parse_email and generate_output functions for complete data processing.")
-                    google_careers_html = [e for e in html_entries if 'GoogleCareers' in e['source']]
-                    if len(google_careers_html) < google_careers_count:
-                        recovery_suggestions.append(f"WARNING: Fewer GoogleCareers entries ({len(google_careers_html)}) in parsed_jobs_output.html than in rats_data.json ({google_careers_count}).\n  Recovery: Verify HTML table generation in process_email_dumps.py.")
-        else:
-            recovery_suggestions.append("ERROR: parsed_jobs_output.html not found.\n  Recovery: Run process_email_dumps.py to generate the file.")
+# Analyze parsed_jobs_output.html; also returns its entries for the cross-check against rats_data.json
+def analyze_html():
+    recovery_suggestions = Counter()
+    html_entries = []
+    html_by_job = {}  # (source, job_position) -> first matching HTML entry
+    google_careers_html_count = 0
+    seen_keys_html = set()
+    try:
+        f = open(HTML_PATH, 'rb')
+    except FileNotFoundError:
+        recovery_suggestions["ERROR: parsed_jobs_output.html not found.\n  Recovery: Run process_email_dumps.py to generate the file."] += 1
+        return recovery_suggestions, html_entries, html_by_job, google_careers_html_count
+    # Search the mapped bytes directly; only the table body is decoded
+    with f, map_file(f) as html_content:
+        if html_content.find(b'<div class="dropdown-content" id="sourceFilter">') == -1:
+            recovery_suggestions["ERROR: Source dropdown filter missing in parsed_jobs_output.html.\n  Recovery: Verify generate_output function in process_email_dumps.py for correct dropdown HTML."] += 1
+        if html_content.find(b'<div class="dropdown-content" id="remoteFilter">') == -1:
+            recovery_suggestions["ERROR: Remote dropdown filter missing in parsed_jobs_output.html.\n  Recovery: Verify generate_output function in process_email_dumps.py for correct dropdown HTML."] += 1
+        if html_content.find(b'<div class="dropdown-content" id="fileFilter">') != -1:
+            recovery_suggestions["WARNING: Redundant File dropdown found in parsed_jobs_output.html.\n  Recovery: Remove File dropdown from generate_output function as only one file per source is used."] += 1
+        if html_content.find(b'Generated by process_email_dumps.py version 7.26') == -1:
+            recovery_suggestions["WARNING: Incorrect or missing footer note in parsed_jobs_output.html.\n  Recovery: Update footer note in generate_output function."] += 1
+        if html_content.find(b'Failed to parse job data') != -1 or html_content.find(b'Failed to process job data') != -1:
+            recovery_suggestions["ERROR: JavaScript errors in parsed_jobs_output.html.\n  Recovery: Validate embedded JSON and JavaScript syntax in generate_output function of process_email_dumps.py."] += 1
+        tbody_start = html_content.find(b'<tbody>')
+        tbody_end = html_content.find(b'</tbody>')
+        if tbody_start != -1 and tbody_end != -1:
+            # Feed the table body to the parser in 1 MiB chunks
+            row_parser = TableRowParser()
+            decoder = codecs.getincrementaldecoder('utf-8')()
+            for pos in range(tbody_start + 7, tbody_end, 1 << 20):
+                row_parser.feed(decoder.decode(html_content[pos:min(pos + (1 << 20), tbody_end)]))
+            row_parser.feed(decoder.decode(b'', final=True))
+            row_parser.close()
+            for cols in row_parser.rows:
+                if len(cols) >= 5:
+                    entry = JobEntry(
+                        source=cols[0].strip().split(' (')[0],
+                        job_position=cols[1].strip(),
+                        location=cols[2].strip(),
+                        minimum_qualifications=cols[3].strip(),
+                        remote=cols[4].strip() == 'Yes'
+                    )
+                    html_entries.append(entry)
+                    html_by_job.setdefault((entry.source, entry.job_position), entry)
+                    if 'GoogleCareers' in entry.source:
+                        google_careers_html_count += 1
+                    key = entry.dedup_key()
+                    seen_count = len(seen_keys_html)
+                    seen_keys_html.add(key)
+                    if len(seen_keys_html) == seen_count:
+                        recovery_suggestions[f"WARNING: Duplicate entry in parsed_jobs_output.html for source {entry.source} and job {entry.job_position}\n  Recovery: Review parse_email function for duplicate job posting extraction."] += 1
+        if not html_entries:
+            recovery_suggestions["ERROR: No entries found in parsed_jobs_output.html.\n  Recovery: Verify rats_data.json contains data. Check generate_output function for HTML table generation."] += 1
+    return recovery_suggestions, html_entries, html_by_job, google_careers_html_count
+
+def analyze_errors():
+    try:
+        # The inputs are disjoint files, so read and scan them concurrently
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            combined_future = executor.submit(analyze_combined_reports)
+            report_future = executor.submit(analyze_parse_errors_report)
+            json_future = executor.submit(analyze_json)
+            txt_future = executor.submit(analyze_txt)
+            html_future = executor.submit(analyze_html)
+        json_suggestions, json_records, google_careers_count = json_future.result()
+        txt_suggestions, txt_entry_count = txt_future.result()
+        html_suggestions, html_entries, html_by_job, google_careers_html_count = html_future.result()
+
+        # Merge in file order so the report lists findings as before
+        recovery_suggestions = Counter()  # suggestion -> occurrences
+        for suggestions in (combined_future.result(), report_future.result(), json_suggestions, txt_suggestions, html_suggestions):
+            recovery_suggestions.update(suggestions)
+
+        # Cross-check parsed_jobs_output.html against the txt and json results
+        if html_entries:
+            if len(html_entries) < txt_entry_count:
+                recovery_suggestions[f"WARNING: Fewer entries ({len(html_entries)}) in parsed_jobs_output.html than in parsed_jobs_output.txt ({txt_entry_count}).\n  Recovery: Verify generate_output function for complete HTML table generation."] += 1
+            for json_entry in json_records:
+                if 'source' in json_entry:
+                    matching_html = html_by_job.get((json_entry['source'], json_entry['job_position']))
+                    if matching_html is None:
+                        recovery_suggestions[f"WARNING: Source {json_entry['source']} with job {json_entry['job_position']} in rats_data.json not found in parsed_jobs_output.html.\n  Recovery: Verify static table generation in process_email_dumps.py."] += 1
+                    else:
+                        for field in CROSS_CHECK_FIELDS:
+                            if field in json_entry and json_entry[field] != getattr(matching_html, field):
+                                recovery_suggestions[f"WARNING: Mismatch in {field} for {json_entry['source']} with job {json_entry['job_position']} between rats_data.json and parsed_jobs_output.html.\n  Recovery: Verify data consistency in generate_output function."] += 1
+            if len(html_entries) < 50:
+                recovery_suggestions[f"WARNING: Limited entries ({len(html_entries)}) in parsed_jobs_output.html.\n  Recovery: Verify parse_email and generate_output functions for complete data processing."] += 1
+            if google_careers_html_count < google_careers_count:
+                recovery_suggestions[f"WARNING: Fewer GoogleCareers entries ({google_careers_html_count}) in parsed_jobs_output.html than in rats_data.json ({google_careers_count}).\n  Recovery: Verify HTML table generation in process_email_dumps.py."] += 1
 
-        with open(output_path, 'w', encoding='utf-8') as f:
+        with open(OUTPUT_PATH, 'w', encoding='utf-8', buffering=1 << 20) as f:
             f.write("R.A.T.S. Error Recovery Report\n")
             f.write("=============================\n\n")
             if recovery_suggestions:
                 f.write("Detected Errors and Recovery Suggestions:\n")
-                f.write("\n".join(recovery_suggestions))
+                f.writelines(f"[x{count}] {msg}\n" if count > 1 else f"{msg}\n" for msg, count in recovery_suggestions.items())
             else:
                 f.write("No errors or warnings detected.\n")
         
-        logging.info(f"Generated error recovery report at {output_path}")
-        print(f"Error recovery report generated at {output_path}")
+        logging.info(f"Generated error recovery report at {OUTPUT_PATH}")
+        print(f"Error recovery report generated at {OUTPUT_PATH}")
     except Exception as e:
         logging.error(f"Error analyzing errors: {e}")
         print(f"Error during analysis. Check {LOG_DIR}/error_recovery.log")
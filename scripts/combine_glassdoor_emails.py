@@ -1,47 +1,82 @@
 # File: combine_glassdoor_emails.py
 # Owner: silicastormsiam
 # Purpose: Combine multiple Glassdoor email dump files into a single glassdoor_email_1.txt for the R.A.T.S. project, preserving all content with separators and deleting original files to streamline processing.
-# Version Control: 1.0
+# Version Control: 1.7
 # Change Log:
-# - 2025-08-07: Version 1.0 - Initial creation to merge glassdoor_email_1.txt, glassdoor_email_2.txt, glassdoor_email_3.txt, and glassdoor_email_4.txt into glassdoor_email_1.txt.
+# - 2026-10-15: Version 1.3 - Resolved the project root, email dumps directory and output path once at import as module constants instead of recomputing them in the function.
+# - 2026-10-15: Version 1.4 - Buffered log records in a MemoryHandler in front of a delayed FileHandler instead of writing each record straight to a log file truncated at startup.
+# - 2026-10-15: Version 1.5 - Advised the kernel of sequential access (posix_fadvise) on each Glassdoor input where available.
+# - 2026-10-15: Version 1.6 - Reworded the MemoryHandler and readahead comments for the Glassdoor inputs.
+# - 2026-10-15: Version 1.7 - Wrote the separator lines with each dump's own line ending (CRLF dumps no longer get LF separators); dumps are copied as raw bytes, so invalid UTF-8 is kept instead of being dropped by the old errors='ignore' read.
 import os
+import shutil
 import logging
+from logging.handlers import MemoryHandler
 
 # Set up logging
-LOG_DIR = os.path.join(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')), 'logs')
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+LOG_DIR = os.path.join(PROJECT_ROOT, 'logs')
 os.makedirs(LOG_DIR, exist_ok=True)
-logging.basicConfig(filename=os.path.join(LOG_DIR, 'combine_glassdoor.log'), level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s', filemode='w')
+# Log through a MemoryHandler; combine_glassdoor.log is only opened when the buffer is flushed
+file_handler = logging.FileHandler(os.path.join(LOG_DIR, 'combine_glassdoor.log'), mode='w', delay=True)
+file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[MemoryHandler(1000, flushLevel=logging.ERROR, target=file_handler)])
+
+# Define paths (resolved once at import)
+EMAIL_DUMPS_DIR = os.path.join(PROJECT_ROOT, 'data', 'email_dumps')
+OUTPUT_PATH = os.path.join(EMAIL_DUMPS_DIR, 'glassdoor_email_1.txt')
+
+# Each Glassdoor dump is streamed once, so hint sequential access where the OS supports it
+USE_FADVISE = hasattr(os, 'posix_fadvise')
+
+# Line ending of src's first line, read ahead without consuming it (the platform's when the first line is not buffered)
+def line_ending(src):
+    head = src.peek()
+    eol = head.find(b'\n')
+    if eol < 0:
+        return os.linesep.encode()
+    return b'\r\n' if head[eol - 1:eol] == b'\r' else b'\n'
 
 def combine_glassdoor_emails():
     try:
-        email_dumps_dir = os.path.join(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')), 'data', 'email_dumps')
-        output_file = os.path.join(email_dumps_dir, 'glassdoor_email_1.txt')
-        glassdoor_files = [f for f in os.listdir(email_dumps_dir) if f.startswith('glassdoor_email_') and f.endswith('.txt')]
+        with os.scandir(EMAIL_DUMPS_DIR) as it:
+            glassdoor_files = [entry for entry in it if entry.name.startswith('glassdoor_email_') and entry.name.endswith('.txt') and entry.is_file()]
         
         if not glassdoor_files:
             logging.warning("No Glassdoor email dump files found.")
             print("No Glassdoor email dump files found.")
             return
         
-        combined_content = []
-        for file in glassdoor_files:
-            file_path = os.path.join(email_dumps_dir, file)
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                combined_content.append(f"--- {file} ---\n{content}\n")
-            logging.info(f"Read content from {file}")
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write("\n".join(combined_content))
-        logging.info(f"Combined {len(glassdoor_files)} Glassdoor files into {output_file}")
-        print(f"Combined {len(glassdoor_files)} Glassdoor files into {output_file}")
+        # Stream each file into a temporary file next to the output (glassdoor_email_1.txt is also an input), then swap it in
+        temp_file = OUTPUT_PATH + '.tmp'
+        try:
+            with open(temp_file, 'wb') as out:
+                for i, entry in enumerate(glassdoor_files):
+                    with open(entry.path, 'rb') as src:
+                        if USE_FADVISE:
+                            os.posix_fadvise(src.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                        # Separator lines use the dump's own line ending, so they match its copied bytes
+                        newline = line_ending(src)
+                        if i:
+                            out.write(newline)  # Blank line between files
+                        out.write(f"--- {entry.name} ---".encode() + newline)
+                        shutil.copyfileobj(src, out, 1 << 20)
+                    out.write(newline)
+                    logging.info(f"Read content from {entry.name}")
+            os.replace(temp_file, OUTPUT_PATH)
+        except Exception:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+            raise
+        logging.info(f"Combined {len(glassdoor_files)} Glassdoor files into {OUTPUT_PATH}")
+        print(f"Combined {len(glassdoor_files)} Glassdoor files into {OUTPUT_PATH}")
         
         # Delete original files (except glassdoor_email_1.txt)
-        for file in glassdoor_files:
-            if file != 'glassdoor_email_1.txt':
-                os.remove(os.path.join(email_dumps_dir, file))
-                logging.info(f"Deleted {file}")
-                print(f"Deleted {file}")
+        for entry in glassdoor_files:
+            if entry.name != 'glassdoor_email_1.txt':
+                os.remove(entry.path)
+                logging.info(f"Deleted {entry.name}")
+                print(f"Deleted {entry.name}")
     except Exception as e:
         logging.error(f"Error combining Glassdoor emails: {e}")
         print(f"Error combining Glassdoor emails. Check {LOG_DIR}/combine_glassdoor.log")
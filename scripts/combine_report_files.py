@@ -1,43 +1,93 @@
 # File: combine_report_files.py
 # Owner: silicastormsiam
 # Purpose: Combine rats_data_report.txt, parsed_jobs_report.txt, parse_errors_report.txt, and error_recovery_report.txt into a single combined_reports.txt for the R.A.T.S. project to simplify error analysis in Notepad++.
-# Version Control: 1.0
+# Version Control: 1.9
 # Change Log:
-# - 2025-08-07: Version 1.0 - Initial creation to merge report files into logs/combined_reports.txt.
+# - 2026-10-15: Version 1.5 - Advised the kernel of sequential access (posix_fadvise) on each report where available.
+# - 2026-10-15: Version 1.6 - Wrote combined_reports.txt through a buffered writer (flushed before each sendfile) so the copyfileobj fallback cannot drop short raw writes.
+# - 2026-10-15: Version 1.7 - Shortened the logging and fadvise comments to fit this script.
+# - 2026-10-15: Version 1.8 - Fell back to copyfileobj from the last sent offset when os.sendfile fails, instead of aborting the combine.
+# - 2026-10-15: Version 1.9 - Wrote the separator lines with each report's own line ending (CRLF reports no longer get LF separators); reports are copied as raw bytes, so invalid UTF-8 is kept instead of being dropped by the old errors='ignore' read.
 import os
+import sys
+import shutil
 import logging
+from logging.handlers import MemoryHandler
 
 # Set up logging
-LOG_DIR = os.path.join(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')), 'logs')
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+LOG_DIR = os.path.join(PROJECT_ROOT, 'logs')
 os.makedirs(LOG_DIR, exist_ok=True)
-logging.basicConfig(filename=os.path.join(LOG_DIR, 'combine_reports.log'), level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s', filemode='w')
+# Records are held in memory and written to combine_reports.log at exit or on the first error
+file_handler = logging.FileHandler(os.path.join(LOG_DIR, 'combine_reports.log'), mode='w', delay=True)
+file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[MemoryHandler(1000, flushLevel=logging.ERROR, target=file_handler)])
+
+# Reports merged in this order, and the combined output
+REPORT_FILES = [
+    'rats_data_report.txt',
+    'parsed_jobs_report.txt',
+    'parse_errors_report.txt',
+    'error_recovery_report.txt'
+]
+OUTPUT_PATH = os.path.join(LOG_DIR, 'combined_reports.txt')
+
+# Linux can copy file-to-file in the kernel with os.sendfile; other platforms copy through a buffer
+USE_SENDFILE = sys.platform.startswith('linux')
+
+# Sequential-readahead hint for each report (posix_fadvise is not available on Windows)
+USE_FADVISE = hasattr(os, 'posix_fadvise')
+
+# Append the rest of src to out (both opened in binary mode; out's buffered header bytes are flushed before the kernel copy)
+def append_file(src, out):
+    if USE_FADVISE:
+        os.posix_fadvise(src.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    if USE_SENDFILE:
+        out.flush()
+        offset = src.tell()
+        try:
+            while sent := os.sendfile(out.fileno(), src.fileno(), offset, 1 << 30):
+                offset += sent
+            return
+        except OSError:
+            # sendfile can be refused (e.g. by some network or FUSE filesystems); copy whatever it did not send
+            src.seek(offset)
+    shutil.copyfileobj(src, out, 1 << 20)
+
+# Line ending of src's first line, read ahead without consuming it (the platform's when the first line is not buffered)
+def line_ending(src):
+    head = src.peek()
+    eol = head.find(b'\n')
+    if eol < 0:
+        return os.linesep.encode()
+    return b'\r\n' if head[eol - 1:eol] == b'\r' else b'\n'
 
 def combine_report_files():
     try:
-        report_files = [
-            'rats_data_report.txt',
-            'parsed_jobs_report.txt',
-            'parse_errors_report.txt',
-            'error_recovery_report.txt'
-        ]
-        output_file = os.path.join(LOG_DIR, 'combined_reports.txt')
-        combined_content = []
-        
-        for file in report_files:
-            file_path = os.path.join(LOG_DIR, file)
-            if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    combined_content.append(f"--- Report File: {file} ---\n{content}\n")
-                logging.info(f"Read content from {file}")
-            else:
-                logging.warning(f"Report file {file} not found.")
-                combined_content.append(f"--- Report File: {file} ---\nFile not found.\n")
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write("\n".join(combined_content))
-        logging.info(f"Combined {len(combined_content)} report files into {output_file}")
-        print(f"Combined {len(combined_content)} report files into {output_file}")
+        # Copy each report straight into the output instead of reading it into memory
+        with open(OUTPUT_PATH, 'wb') as out:
+            for i, file in enumerate(REPORT_FILES):
+                file_path = os.path.join(LOG_DIR, file)
+                # Open directly rather than checking os.path.exists first: one syscall per report
+                try:
+                    src = open(file_path, 'rb')
+                except FileNotFoundError:
+                    src = None
+                # Separator lines use the report's own line ending, so they match its copied bytes
+                newline = line_ending(src) if src else os.linesep.encode()
+                if i:
+                    out.write(newline)  # Blank line between reports
+                out.write(f"--- Report File: {file} ---".encode() + newline)
+                if src is None:
+                    logging.warning(f"Report file {file} not found.")
+                    out.write(b"File not found.")
+                else:
+                    with src:
+                        append_file(src, out)
+                    logging.info(f"Read content from {file}")
+                out.write(newline)
+        logging.info(f"Combined {len(REPORT_FILES)} report files into {OUTPUT_PATH}")
+        print(f"Combined {len(REPORT_FILES)} report files into {OUTPUT_PATH}")
     except Exception as e:
         logging.error(f"Error combining report files: {e}")
         print(f"Error combining report files. Check {LOG_DIR}/combine_reports.log")
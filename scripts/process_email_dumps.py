@@ -1,28 +1,38 @@
 # File: process_email_dumps.py
 # Owner: silicastormsiam
 # Purpose: Process email dumps for R.A.T.S. project, including source identification, parsing, and storage in JSON for job alert management, prioritizing English job titles and Remote positions, with minimal console output, robust logging limited to data errors per run, and user-friendly output files (txt/html/reports) with static HTML table, sortable headers, dropdown checkbox filtering, and pivot tables styled with Cyberpunk Monk color palette.
-# Version Control: 7.26
+# Version Control: 7.72
 # Change Log:
-# - 2025-08-07: Version 7.22 - Removed redundant File dropdown; added Remote dropdown filter; fixed parsing issues for GoogleCareers; enhanced English-only filtering; maintained .gitignore at version 2.3; updated analyze_errors.py for processing failure diagnostics; retained separate report files, no line limits, sortable headers, dropdown checkbox filtering, Cyberpunk Monk palette, data error logging, English-only title prioritization, Remote prioritization; ensured metadata compliance.
-# - 2025-08-07: Version 7.23 - Fixed 'pos' keyword error in parse_email; removed File column; added footer note with script version; restored all job postings with deduplication; enhanced GoogleCareers parsing; improved remote detection; maintained .gitignore at version 2.3; updated analyze_errors.py for remote field diagnostics; retained separate report files, no line limits, sortable headers, dropdown checkbox filtering, Cyberpunk Monk palette, data error logging, English-only title prioritization, Remote prioritization; ensured metadata compliance.
-# - 2025-08-07: Version 7.24 - Fixed limited data issue by improving section parsing and deduplication; corrected non-English job titles and invalid positions; enhanced remote status detection; maintained .gitignore at version 2.3; updated analyze_errors.py for remote field and parsing diagnostics; retained separate report files, no line limits, sortable headers, dropdown checkbox filtering, Cyberpunk Monk palette, data error logging, English-only title prioritization, Remote prioritization; ensured metadata compliance.
-# - 2025-08-07: Version 7.25 - Removed deduplication to restore all data; fixed IndentationError in HTML output; corrected non-English job titles and invalid locations; enhanced remote detection; maintained .gitignore at version 2.3; updated analyze_errors.py for indentation and data limitation diagnostics; retained separate report files, no line limits, sortable headers, dropdown checkbox filtering, Cyberpunk Monk palette, data error logging, English-only title prioritization, Remote prioritization; ensured metadata compliance.
-# - 2025-08-07: Version 7.26 - Fixed JavaScript filtering to display all data; corrected IndentationError in HTML output; refined non-English job title filtering; improved remote status detection; maintained .gitignore at version 2.3; updated analyze_errors.py for JavaScript and parsing diagnostics; retained separate report files, no line limits, sortable headers, dropdown checkbox filtering, Cyberpunk Monk palette, data error logging, English-only title prioritization, Remote prioritization; ensured metadata compliance.
+# - 2026-10-15: Version 7.68 - Shared the ingested SHA-1 set with forked workers through the module-level INGESTED set instead of pickling it into every task.
+# - 2026-10-15: Version 7.69 - Wrote the noise and fallback-subject alternations directly as NOISE_LINE_RE and FALLBACK_SUBJECT_RE and removed the keyword tuples they were built from.
+# - 2026-10-15: Version 7.70 - Restored str() on the static table cells so a non-string field (e.g. a hand-edited null) renders as text instead of dropping the row.
+# - 2026-10-15: Version 7.71 - Documented that only the DEBUG progress calls in parse_email use lazy %-style arguments, so they are never formatted at the configured WARNING level; all other log calls keep f-strings.
+# - 2026-10-15: Version 7.72 - Replaced the one-phrase PAID_VACATION_KEYWORDS tuple with a plain 'weeks of paid vacation' substring test on the lowercased line.
 import os
 import re
+import mmap
 import json
+import shutil
+import hashlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 import logging
 import html
 import unicodedata
+try:
+    import orjson  # Optional: faster reading of rats_data.json and encoding of the HTML data; stdlib json produces the same result when unavailable
+except ImportError:
+    orjson = None
 
 # Set up logging to file (clear previous log to limit to current run)
-LOG_DIR = os.path.join(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')), 'logs')
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+LOG_DIR = os.path.join(PROJECT_ROOT, 'logs')
+PARSE_ERRORS_LOG_PATH = os.path.join(LOG_DIR, 'parse_errors.log')
 os.makedirs(LOG_DIR, exist_ok=True)
-logging.basicConfig(filename=os.path.join(LOG_DIR, 'parse_errors.log'), level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s', filemode='w')
+logging.basicConfig(filename=PARSE_ERRORS_LOG_PATH, level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s', filemode='w')
 
 # Define paths (absolute for robustness)
-PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 EMAIL_DUMPS_DIR = os.path.join(PROJECT_ROOT, 'data', 'email_dumps')
 JSON_PATH = os.path.join(PROJECT_ROOT, 'data', 'rats_data.json')
 TXT_OUTPUT_PATH = os.path.join(PROJECT_ROOT, 'data', 'parsed_jobs_output.txt')
@@ -47,15 +57,93 @@ SENDER_PATTERNS = {
     "Indeed": r"alert@indeed.com"
 }
 
+# Compiled once at import; dict order is the match priority in identify_source
+SOURCE_RES = {source: re.compile(pattern, re.IGNORECASE) for source, pattern in SOURCES.items()}
+SENDER_RES = {source: re.compile(pattern, re.IGNORECASE) for source, pattern in SENDER_PATTERNS.items()}
+GOOGLE_RE = re.compile(r'\bGoogle\b', re.IGNORECASE)
+LINKEDIN_RE = re.compile(r'\bLinkedIn\b', re.IGNORECASE)
+
+# Header (metadata) patterns for the first lines of each email section
+EMAIL_RE = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+', re.IGNORECASE)
+SUBJECT_EXCLUDE_RE = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+|^\w{3},\s+\w{3}\s+\d{1,2}(,\s+\d{4})?,\s+\d{1,2}:\d{2}\s*(?:AM|PM)', re.IGNORECASE)
+SUBJECT_KEYWORD_RE = re.compile(r'job|jobs|career|careers|opportunity|opportunities|New job\(s\)|Project|Program|Assistant|alert|matching', re.IGNORECASE)
+DATE_LINE_RE = re.compile(r'^\w{3},\s+\w{3}\s+\d{1,2}(,\s+\d{4})?,\s+\d{1,2}:\d{2}\s*(?:AM|PM)\s*\(\d+ (?:hours|days) ago\)$|^\w{3}\s+\d{1,2}(,\s+\d{4})?,\s+\d{1,2}:\d{2}\s*(?:AM|PM)|^\w{3}\s+\d{1,2}(,\s+\d{4})?$|^Today$|\d{4}-\d{2}-\d{2}T|^\d{1,2}:\d{2}\s*(?:AM|PM)\s*\(\d+ (?:hours|days) ago\)$|^as-it-happens$', re.IGNORECASE)
+
+# Dumps at least this large are decoded straight from a read-only mapping; smaller ones are faster to read in text mode
+MMAP_MIN_SIZE = 1 << 20
+
+# Buffer and copy chunk size for the log reports
+REPORT_CHUNK_SIZE = 1 << 20
+
+# Separator between the dumps in a combined Glassdoor file
+GLASSDOOR_SEPARATOR_RE = re.compile(r'--- glassdoor_email_\d+\.txt ---')
+
+# Plain keyword list (lowercase), matched as substrings of the lowercased line by contains_keyword
+JOB_SECTION_KEYWORDS = ('turn on job alerts for this search', 'job alerts', 'new jobs', 'your job listings for', 'new jobs on linkedin', 'jobs matching your search')
+
+# Lowercase alternations searched in the lowercased line (noise lines are dropped; the subject fallback takes the first hit)
+NOISE_LINE_RE = re.compile(r'none selected|skip to content|using gmail with screen readers|to me|google apps|–conversations|your job alert|has been created')
+FALLBACK_SUBJECT_RE = re.compile(r'job|jobs|career|careers|opportunity|opportunities|alert|matching')
+
+# Body patterns for parse_email (searched over whole sections by first_matching_line, so whitespace never spans a newline)
+FALLBACK_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}|\w{3},[^\S\n]+\w{3}[^\S\n]+\d{1,2}|as-it-happens|\d{1,2}:\d{2}[^\S\n]*(?:AM|PM)', re.IGNORECASE)
+
+# Posting patterns, written in lowercase and matched against the lowercased line (no re.IGNORECASE)
+# Enhanced patterns for GoogleCareers
+POSITION_RE = re.compile(r'(?:manager|engineer|developer|analyst|specialist|associate|coordinator|director|senior|junior|lead|executive|officer|consultant|designer|administrator|technician|operator|supervisor|architect|scientist|artist|writer|teacher|professor|nurse|doctor|lawyer|accountant|marketing|sales|hr|it|support|service|project|program|assistant|hvac|customer solutions|cloud|ai|machine learning|data scientist|product manager|business|operations|strategist|researcher|technical lead|acquisition|martech)\b(?:\s*(?:[-/&]\s*\w+)*)?')
+# LOCATION_RE is only used as a yes/no test, so its catch-all is just "some all-letter word" (the old \b[a-z][a-z\s]*(?:,\s*[a-z]{2})?\b matched exactly the same lines with more backtracking)
+LOCATION_RE = re.compile(r'(?:bangkok|manhattan|new york|long island city|astoria|remote|on-site|hybrid|thailand|singapore|usa|india|london|san francisco|seattle|mountain view|sunnyvale|atlanta|chicago|boston|dublin|zurich|hyderabad|bangalore|tokyo|sydney|kuala lumpur|canada|namer|[a-z][a-z]+,\s*[a-z]{2}|place\s+.*|\b[a-z]+\b|multiple locations)')
+QUALIFICATIONS_RE = re.compile(r"(?:bachelor\'s degree|master\'s degree|phd|years of experience|practical experience|microsoft|autocad|architecture|construction|management|full-time|background check|weekly pay|equivalent experience|ability to|knowledge of|proficient in|experience with|required|preferred|qualifications|skills|education|minimum qualifications|easy apply|hour shift|report writing|commission pay|oracle|pmp|weekends as needed|yearly pay|mid-level|multiple hires|laboratory|paid parental leave|fluency in [a-z]+|certifications?|technical skills|strong communication|team collaboration|\$[0-9]+k\s*-\s*\$[0-9]+k)")
+
+# GoogleCareers fallback when the job section yields no postings
+GOOGLE_POSITION_RE = re.compile(r'\b[a-z][a-z\s]*(?:manager|engineer|specialist|analyst|developer|consultant|coordinator|director|customer solutions|cloud|ai|machine learning|data scientist|product manager|business|operations|strategist|researcher|technical lead|acquisition|martech)\b(?:\s*(?:[-/&]\s*\w+)*)?')
+
+# Line checks shared by the posting loops
+REMOTE_RE = re.compile(r'\bremote\b|\(remote\)|hybrid|remote eligible')
+TIME_RE = re.compile(r'\d{1,2}:\d{2}\s*(?:am|pm)')
+
+# Check whether an already lowercased line contains any of the keywords (substring tests instead of a regex alternation)
+def contains_keyword(line_lc, keywords):
+    return any(keyword in line_lc for keyword in keywords)
+
+# Normalize a non-ASCII string to ASCII, ignoring errors (ASCII strings and non-strings are returned unchanged)
+def ascii_fold(value):
+    if isinstance(value, str) and not value.isascii():
+        return unicodedata.normalize('NFKD', value).encode('ascii', 'ignore').decode('ascii')
+    return value
+
+# Search the newline-joined lines in one pass; returns (index of the first matching line, match) or (None, None)
+def first_matching_line(pattern, lines, lowercase=False):
+    text = '\n'.join(lines)
+    if lowercase:
+        text = text.lower()  # str.lower never adds or removes newlines, so line indexes still line up
+    match = pattern.search(text)
+    if not match:
+        return None, None
+    return text.count('\n', 0, match.start()), match
+
+# Read an email dump as text (UTF-8 with undecodable bytes dropped, universal newlines)
+def read_dump(file_path):
+    if os.path.getsize(file_path) < MMAP_MIN_SIZE:
+        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            return f.read()
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        content = str(mm, 'utf-8', 'ignore')
+    return content.replace('\r\n', '\n').replace('\r', '\n')
+
 # Initialize JSON storage
 def init_json():
     try:
-        if not os.path.exists(JSON_PATH):
-            with open(JSON_PATH, 'w', encoding='utf-8') as f:
-                json.dump([], f)
+        # Load the existing store in one binary read; a missing one is created empty and returned without reading it back
+        try:
+            with open(JSON_PATH, 'rb') as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson else json.loads(raw)
+        except FileNotFoundError:
+            with open(JSON_PATH, 'wb') as f:
+                f.write(b'[]')
             logging.warning(f"Created {JSON_PATH}")
-        with open(JSON_PATH, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+            data = []
         logging.warning(f"Initialized JSON storage at {JSON_PATH} with {len(data)} entries")
         return data
     except json.JSONDecodeError as e:
@@ -65,7 +153,7 @@ def init_json():
         logging.error(f"JSON initialization error: {e}")
         raise
 
-# Save to JSON (append without overwriting)
+# Save to JSON (append to the in-memory data; write_json persists the whole run once)
 def save_to_json(data, entry):
     try:
         # Validate entry before appending
@@ -75,46 +163,233 @@ def save_to_json(data, entry):
                 logging.error(f"Missing field {field} in entry for {entry.get('filename', 'unknown')}")
                 raise ValueError(f"Missing field {field} in entry")
         data.append(entry)
-        with open(JSON_PATH, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4)
-        logging.warning(f"Saved entry for {entry['filename']} to {JSON_PATH}")
-    except json.JSONDecodeError as e:
-        logging.error(f"Error saving to JSON for {entry.get('filename', 'unknown')}: Invalid JSON: {e}")
-        raise
     except Exception as e:
         logging.error(f"Error saving to JSON for {entry.get('filename', 'unknown')}: {e}")
         raise
 
+# Write all entries to JSON in one pass; the file is only replaced once the new copy is complete
+def write_json(data):
+    temp_path = JSON_PATH + '.tmp'
+    try:
+        with open(temp_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            json.dump(data, f, indent=4)
+        os.replace(temp_path, JSON_PATH)
+        logging.warning(f"Saved {len(data)} entries to {JSON_PATH}")
+    except Exception as e:
+        logging.error(f"Error saving to JSON: {e}")
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+# Entry fields embedded in the HTML page (table columns, filters and pivot dimensions); the rest stays in rats_data.json only
+HTML_FIELDS = ('sender', 'subject', 'date', 'source', 'job_position', 'location', 'minimum_qualifications', 'remote')
+
+# Static HTML page (Cyberpunk Monk palette); literal CSS/JS braces are doubled for str.format
+HTML_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+    <title>R.A.T.S. - Recruitment Alert Tracking System for CAPM</title>
+    <style>
+        body {{ font-family: Arial, sans-serif; margin: 20px; background-color: #1F2937; color: #1F2937; }}
+        h1 {{ text-align: center; color: #FFFFFF; background-color: #0F172A; padding: 10px; }}
+        table {{ width: 100%; border-collapse: collapse; margin-top: 20px; background-color: #E2E8F0; }}
+        th, td {{ border: 1px solid #D1D5DB; padding: 8px; text-align: left; color: #4B5563; }}
+        th {{ background-color: #0F172A; color: #FFFFFF; cursor: pointer; }}
+        th:hover {{ color: #F472B6; }}
+        tr:nth-child(even) {{ background-color: #D1D5DB; }}
+        tr:hover {{ background-color: #E2E8F0; }}
+        .filter {{ margin-bottom: 20px; background-color: #D1D5DB; padding: 10px; }}
+        .filter label {{ color: #F472B6; font-size: 18px; }}
+        .dropdown {{ position: relative; display: inline-block; margin-right: 20px; }}
+        .dropdown-button {{ background-color: #3B82F6; color: #FFFFFF; border: 1px solid #FFFFFF; padding: 5px 10px; cursor: pointer; }}
+        .dropdown-button:hover {{ background-color: #2563EB; }}
+        .dropdown-content {{ display: none; position: absolute; background-color: #E2E8F0; min-width: 200px; box-shadow: 0px 8px 16px 0px rgba(0,0,0,0.2); z-index: 1; padding: 10px; }}
+        .dropdown:hover .dropdown-content {{ display: block; }}
+        .dropdown-option {{ padding: 5px; }}
+        .error {{ color: #DC2626; }}
+        footer {{ margin-top: 20px; text-align: center; color: #4B5563; }}
+        #pivotTable {{ margin-top: 20px; border: 1px solid #F472B6; background-color: #0F172A; }}
+        #pivotTable .pvtTable {{ background-color: #E2E8F0; color: #4B5563; }}
+        #pivotTable .pvtTable th {{ background-color: #0F172A; color: #FFFFFF; }}
+        #pivotTable .pvtTable td {{ border: 1px solid #D1D5DB; }}
+        #debugJson {{ display: none; margin-top: 20px; background-color: #E2E8F0; padding: 10px; }}
+        #debugToggle {{ margin-top: 10px; background-color: #3B82F6; color: #FFFFFF; border: 1px solid #FFFFFF; padding: 5px 10px; cursor: pointer; }}
+        #debugToggle:hover {{ background-color: #2563EB; }}
+    </style>
+    <script src="https://code.jquery.com/jquery-3.6.0.min.js"></script>
+    <script src="https://cdnjs.cloudflare.com/ajax/libs/pivottable/2.23.0/pivot.min.js"></script>
+    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/pivottable/2.23.0/pivot.min.css">
+    <script>
+        document.addEventListener("DOMContentLoaded", function() {{
+            let data = [];
+            try {{
+                data = {json_data_str};
+                console.log("JSON data loaded with " + data.length + " entries");
+            }} catch (e) {{
+                console.error("Failed to parse JSON data: " + e.message);
+                document.getElementById("jobTable").insertAdjacentHTML("afterend", '<p class="error">Failed to parse job data: ' + e.message + '</p>');
+            }}
+            function renderTable(filteredData) {{
+                console.log("Rendering table with " + filteredData.length + " entries");
+                const tbody = document.querySelector("#jobTable tbody");
+                tbody.innerHTML = "";
+                filteredData.forEach(entry => {{
+                    tbody.innerHTML += `
+                        <tr data-source="${{entry.source}}" data-remote="${{entry.remote ? "Yes" : "No"}}">
+                            <td>${{entry.source}} (${{entry.sender}})</td>
+                            <td>${{entry.job_position}}</td>
+                            <td>${{entry.location}}</td>
+                            <td>${{entry.minimum_qualifications.replace(/\\n/g, "<br>")}}</td>
+                            <td>${{entry.remote ? "Yes" : "No"}}</td>
+                        </tr>`;
+                }});
+                if (filteredData.length === 0) {{
+                    tbody.innerHTML = '<tr><td colspan="5">No data matches the selected filters</td></tr>';
+                }}
+            }}
+            try {{
+                renderTable(data);
+                $("#pivotTable").pivotUI(data, {{
+                    rows: ["source"],
+                    cols: ["remote"],
+                    vals: ["job_position"],
+                    aggregatorName: "Count",
+                    rendererName: "Table"
+                }});
+                console.log("Pivot table rendered");
+            }} catch (e) {{
+                console.error("Failed to process job data: " + e.message);
+                document.getElementById("jobTable").insertAdjacentHTML("afterend", '<p class="error">Failed to process job data: ' + e.message + '</p>');
+            }}
+            document.querySelectorAll("#jobTable th").forEach(th => {{
+                th.addEventListener("click", function() {{
+                    const column = this.getAttribute("data-column");
+                    let order = this.getAttribute("data-order") === "asc" ? "desc" : "asc";
+                    this.setAttribute("data-order", order);
+                    console.log("Sorting by " + column + " in " + order + " order");
+                    data.sort((a, b) => {{
+                        let aValue = a[column] || "";
+                        let bValue = b[column] || "";
+                        if (column === "remote") {{
+                            aValue = a[column] ? "Yes" : "No";
+                            bValue = b[column] ? "Yes" : "No";
+                        }}
+                        return order === "asc" ? aValue.localeCompare(bValue) : bValue.localeCompare(aValue);
+                    }});
+                    renderTable(data);
+                }});
+            }});
+            function applyFilters() {{
+                console.log("Applying filters");
+                const selectedSources = Array.from(document.querySelectorAll("#sourceFilter .filter-checkbox:checked")).map(cb => cb.value);
+                const selectedRemotes = Array.from(document.querySelectorAll("#remoteFilter .filter-checkbox:checked")).map(cb => cb.value);
+                console.log("Selected Sources: " + selectedSources);
+                console.log("Selected Remotes: " + selectedRemotes);
+                const filteredData = data.filter(entry => {{
+                    const sourceMatch = selectedSources.length === 0 || selectedSources.includes(entry.source);
+                    const remoteMatch = selectedRemotes.length === 0 || selectedRemotes.includes(entry.remote ? "Yes" : "No");
+                    return sourceMatch && remoteMatch;
+                }});
+                console.log("Filtered data to " + filteredData.length + " entries");
+                renderTable(filteredData);
+            }}
+            document.querySelectorAll(".filter-checkbox").forEach(cb => {{
+                cb.addEventListener("change", function() {{
+                    console.log("Checkbox changed: " + this.value + " is " + (this.checked ? "checked" : "unchecked"));
+                    applyFilters();
+                }});
+            }});
+            document.getElementById("resetFilter").addEventListener("click", function() {{
+                document.querySelectorAll(".filter-checkbox").forEach(cb => {{
+                    cb.checked = false;
+                    console.log("Reset checkbox: " + cb.value);
+                }});
+                console.log("Filters reset");
+                renderTable(data);
+            }});
+            document.getElementById("debugToggle").addEventListener("click", function() {{
+                const debugJson = document.getElementById("debugJson");
+                debugJson.style.display = debugJson.style.display === "none" ? "block" : "none";
+                console.log("Debug JSON toggled");
+            }});
+        }});
+    </script>
+</head>
+<body>
+    <h1>R.A.T.S. - Recruitment Alert Tracking System for CAPM</h1>
+    <div class="filter">
+        <div class="dropdown">
+            <label>Select Sources: </label>
+            <button class="dropdown-button">Select Sources</button>
+            <div class="dropdown-content" id="sourceFilter">
+                {source_options}
+            </div>
+        </div>
+        <div class="dropdown">
+            <label>Select Remote: </label>
+            <button class="dropdown-button">Select Remote</button>
+            <div class="dropdown-content" id="remoteFilter">
+                {remote_options}
+            </div>
+        </div>
+        <button id="resetFilter">Reset Filters</button>
+    </div>
+    <table id="jobTable">
+        <thead>
+            <tr>
+                <th data-column="source">Source (Email)</th>
+                <th data-column="job_position">Job Position</th>
+                <th data-column="location">Location</th>
+                <th data-column="minimum_qualifications">Minimum Requirements</th>
+                <th data-column="remote">Remote</th>
+            </tr>
+        </thead>
+        <tbody>
+            {static_table}
+        </tbody>
+    </table>
+    <h2>Pivot Table</h2>
+    <div id="pivotTable"></div>
+    <button id="debugToggle">Toggle Debug JSON</button>
+    <pre id="debugJson">{debug_json}</pre>
+    <footer>Generated by process_email_dumps.py version 7.26</footer>
+</body>
+</html>"""
+
+# Write a report: header followed by the source file, streamed in 1 MiB chunks
+def write_report(report_path, header, source_path):
+    with open(report_path, 'wb', buffering=REPORT_CHUNK_SIZE) as out, open(source_path, 'rb') as src:
+        out.write(header.encode('utf-8'))
+        shutil.copyfileobj(src, out, REPORT_CHUNK_SIZE)
+
 # Generate user-friendly output files (txt, html, reports)
 def generate_output(data):
     try:
-        # Text output (all entries)
-        with open(TXT_OUTPUT_PATH, 'w', encoding='utf-8') as f:
-            f.write("R.A.T.S. - Recruitment Alert Tracking System for CAPM\n")
-            f.write("==================================================\n")
-            for entry in data:
-                f.write(f"\nSource: {entry['source']} (Email: {entry['sender']})\n")
-                f.write(f"Job Position: {entry['job_position']}\n")
-                f.write(f"Location: {entry['location']}\n")
-                f.write(f"Min Requirements: {entry['minimum_qualifications']}\n")
-                f.write(f"Remote: {'Yes' if entry.get('remote', False) else 'No'}\n")
-                f.write("------------------------------------\n")
+        # Text output (all entries, one preformatted block per entry)
+        with open(TXT_OUTPUT_PATH, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write("R.A.T.S. - Recruitment Alert Tracking System for CAPM\n"
+                    "==================================================\n")
+            f.writelines(
+                f"\nSource: {entry['source']} (Email: {entry['sender']})\n"
+                f"Job Position: {entry['job_position']}\n"
+                f"Location: {entry['location']}\n"
+                f"Min Requirements: {entry['minimum_qualifications']}\n"
+                f"Remote: {'Yes' if entry.get('remote', False) else 'No'}\n"
+                "------------------------------------\n"
+                for entry in data
+            )
         logging.warning(f"Generated text output at {TXT_OUTPUT_PATH} with {len(data)} entries")
         
         # Validate JSON data with encoding checks
         json_data_str = "[]"
         validated_data = []
         try:
-            for entry in data:
-                validated_entry = {}
-                for key, value in entry.items():
-                    if isinstance(value, str):
-                        # Normalize Unicode and encode to ASCII, ignoring errors
-                        validated_entry[key] = unicodedata.normalize('NFKD', value).encode('ascii', 'ignore').decode('ascii')
-                    else:
-                        validated_entry[key] = value
-                validated_data.append(validated_entry)
-            json_data_str = json.dumps(validated_data, indent=2, ensure_ascii=False)
+            fold = ascii_fold
+            validated_data = [{key: fold(entry[key]) for key in HTML_FIELDS if key in entry} for entry in data]
+            if orjson:
+                json_data_str = orjson.dumps(validated_data, option=orjson.OPT_INDENT_2).decode('utf-8')
+            else:
+                json_data_str = json.dumps(validated_data, indent=2, ensure_ascii=False)
             logging.warning(f"Validated JSON data with {len(validated_data)} entries for HTML output")
         except json.JSONDecodeError as e:
             logging.error(f"JSON serialization error: Invalid JSON data: {e}")
@@ -123,29 +398,48 @@ def generate_output(data):
             logging.error(f"JSON serialization error: {e}")
             json_data_str = "[]"
         
-        # Generate static table in Python
+        # Generate static table in Python (rows collected in a list and joined once)
         static_table = ""
         if validated_data:
+            table_rows = []
+            escape = html.escape  # Bound once for the cells of every row
+            # Sources and senders repeat across rows, so each distinct value is escaped once
+            source_cache = {}
+            sender_cache = {}
             for entry in validated_data:
                 try:
-                    static_table += (
-                        f'<tr data-source="{html.escape(str(entry["source"]))}" data-remote="{html.escape("Yes" if entry.get("remote", False) else "No")}">'
-                        f'<td>{html.escape(str(entry["source"]))} ({html.escape(str(entry["sender"]))})</td>'
-                        f'<td>{html.escape(str(entry["job_position"]))}</td>'
-                        f'<td>{html.escape(str(entry["location"]))}</td>'
-                        f'<td>{html.escape(str(entry["minimum_qualifications"])).replace("\n", "<br>")}</td>'
-                        f'<td>{"Yes" if entry.get("remote", False) else "No"}</td>'
+                    source = entry["source"]
+                    source_html = source_cache.get(source)
+                    if source_html is None:
+                        source_html = source_cache[source] = escape(str(source))
+                    sender = entry["sender"]
+                    sender_html = sender_cache.get(sender)
+                    if sender_html is None:
+                        sender_html = sender_cache[sender] = escape(str(sender))
+                    remote = "Yes" if entry.get("remote", False) else "No"  # Plain ASCII, nothing to escape
+                    table_rows.append(
+                        f'<tr data-source="{source_html}" data-remote="{remote}">'
+                        f'<td>{source_html} ({sender_html})</td>'
+                        f'<td>{escape(str(entry["job_position"]))}</td>'
+                        f'<td>{escape(str(entry["location"]))}</td>'
+                        f'<td>{escape(str(entry["minimum_qualifications"])).replace("\n", "<br>")}</td>'
+                        f'<td>{remote}</td>'
                         f'</tr>'
                     )
                 except Exception as e:
                     logging.error(f"Error generating static table entry for {entry.get('source', 'unknown')}: {e}")
+            static_table = ''.join(table_rows)
             logging.warning(f"Generated static table with {len(validated_data)} entries")
         else:
             static_table = '<tr><td colspan="5">No data available</td></tr>'
             logging.warning("No data available for static table")
         
         # Generate source options for dropdown
-        source_options = "".join([f'<div class="dropdown-option"><input type="checkbox" class="filter-checkbox" data-type="source" value="{html.escape(source)}"> {html.escape(source)}</div>' for source in sorted(set(entry["source"] for entry in validated_data))])
+        option_rows = []
+        for source in sorted({entry["source"] for entry in validated_data}):
+            source_html = html.escape(source)  # Used for both the value and the label
+            option_rows.append(f'<div class="dropdown-option"><input type="checkbox" class="filter-checkbox" data-type="source" value="{source_html}"> {source_html}</div>')
+        source_options = "".join(option_rows)
         # Generate remote options for dropdown
         remote_options = (
             '<div class="dropdown-option"><input type="checkbox" class="filter-checkbox" data-type="remote" value="Yes"> Yes</div>'
@@ -153,199 +447,19 @@ def generate_output(data):
         )
         
         # HTML output (static table with sortable headers, source and remote dropdown checkbox filtering, and pivot tables, Cyberpunk Monk palette)
-        with open(HTML_OUTPUT_PATH, 'w', encoding='utf-8') as f:
-            html_content = [
-                '<!DOCTYPE html>',
-                '<html>',
-                '<head>',
-                '    <title>R.A.T.S. - Recruitment Alert Tracking System for CAPM</title>',
-                '    <style>',
-                '        body { font-family: Arial, sans-serif; margin: 20px; background-color: #1F2937; color: #1F2937; }',
-                '        h1 { text-align: center; color: #FFFFFF; background-color: #0F172A; padding: 10px; }',
-                '        table { width: 100%; border-collapse: collapse; margin-top: 20px; background-color: #E2E8F0; }',
-                '        th, td { border: 1px solid #D1D5DB; padding: 8px; text-align: left; color: #4B5563; }',
-                '        th { background-color: #0F172A; color: #FFFFFF; cursor: pointer; }',
-                '        th:hover { color: #F472B6; }',
-                '        tr:nth-child(even) { background-color: #D1D5DB; }',
-                '        tr:hover { background-color: #E2E8F0; }',
-                '        .filter { margin-bottom: 20px; background-color: #D1D5DB; padding: 10px; }',
-                '        .filter label { color: #F472B6; font-size: 18px; }',
-                '        .dropdown { position: relative; display: inline-block; margin-right: 20px; }',
-                '        .dropdown-button { background-color: #3B82F6; color: #FFFFFF; border: 1px solid #FFFFFF; padding: 5px 10px; cursor: pointer; }',
-                '        .dropdown-button:hover { background-color: #2563EB; }',
-                '        .dropdown-content { display: none; position: absolute; background-color: #E2E8F0; min-width: 200px; box-shadow: 0px 8px 16px 0px rgba(0,0,0,0.2); z-index: 1; padding: 10px; }',
-                '        .dropdown:hover .dropdown-content { display: block; }',
-                '        .dropdown-option { padding: 5px; }',
-                '        .error { color: #DC2626; }',
-                '        footer { margin-top: 20px; text-align: center; color: #4B5563; }',
-                '        #pivotTable { margin-top: 20px; border: 1px solid #F472B6; background-color: #0F172A; }',
-                '        #pivotTable .pvtTable { background-color: #E2E8F0; color: #4B5563; }',
-                '        #pivotTable .pvtTable th { background-color: #0F172A; color: #FFFFFF; }',
-                '        #pivotTable .pvtTable td { border: 1px solid #D1D5DB; }',
-                '        #debugJson { display: none; margin-top: 20px; background-color: #E2E8F0; padding: 10px; }',
-                '        #debugToggle { margin-top: 10px; background-color: #3B82F6; color: #FFFFFF; border: 1px solid #FFFFFF; padding: 5px 10px; cursor: pointer; }',
-                '        #debugToggle:hover { background-color: #2563EB; }',
-                '    </style>',
-                '    <script src="https://code.jquery.com/jquery-3.6.0.min.js"></script>',
-                '    <script src="https://cdnjs.cloudflare.com/ajax/libs/pivottable/2.23.0/pivot.min.js"></script>',
-                '    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/pivottable/2.23.0/pivot.min.css">',
-                '    <script>',
-                '        document.addEventListener("DOMContentLoaded", function() {',
-                '            let data = [];',
-                '            try {',
-                f'                data = {json_data_str};',
-                '                console.log("JSON data loaded with " + data.length + " entries");',
-                '            } catch (e) {',
-                '                console.error("Failed to parse JSON data: " + e.message);',
-                '                document.getElementById("jobTable").insertAdjacentHTML("afterend", \'<p class="error">Failed to parse job data: \' + e.message + \'</p>\');',
-                '            }',
-                '            function renderTable(filteredData) {',
-                '                console.log("Rendering table with " + filteredData.length + " entries");',
-                '                const tbody = document.querySelector("#jobTable tbody");',
-                '                tbody.innerHTML = "";',  # Clear table before rendering
-                '                filteredData.forEach(entry => {',
-                '                    tbody.innerHTML += `',
-                '                        <tr data-source="${entry.source}" data-remote="${entry.remote ? "Yes" : "No"}">',
-                '                            <td>${entry.source} (${entry.sender})</td>',
-                '                            <td>${entry.job_position}</td>',
-                '                            <td>${entry.location}</td>',
-                '                            <td>${entry.minimum_qualifications.replace(/\\n/g, "<br>")}</td>',
-                '                            <td>${entry.remote ? "Yes" : "No"}</td>',
-                '                        </tr>`;',
-                '                });',
-                '                if (filteredData.length === 0) {',
-                '                    tbody.innerHTML = \'<tr><td colspan="5">No data matches the selected filters</td></tr>\';',
-                '                }',
-                '            }',
-                '            try {',
-                '                renderTable(data);',  # Display all data initially
-                '                $("#pivotTable").pivotUI(data, {',
-                '                    rows: ["source"],',
-                '                    cols: ["remote"],',
-                '                    vals: ["job_position"],',
-                '                    aggregatorName: "Count",',
-                '                    rendererName: "Table"',
-                '                });',
-                '                console.log("Pivot table rendered");',
-                '            } catch (e) {',
-                '                console.error("Failed to process job data: " + e.message);',
-                '                document.getElementById("jobTable").insertAdjacentHTML("afterend", \'<p class="error">Failed to process job data: \' + e.message + \'</p>\');',
-                '            }',
-                '            document.querySelectorAll("#jobTable th").forEach(th => {',
-                '                th.addEventListener("click", function() {',
-                '                    const column = this.getAttribute("data-column");',
-                '                    let order = this.getAttribute("data-order") === "asc" ? "desc" : "asc";',
-                '                    this.setAttribute("data-order", order);',
-                '                    console.log("Sorting by " + column + " in " + order + " order");',
-                '                    data.sort((a, b) => {',
-                '                        let aValue = a[column] || "";',
-                '                        let bValue = b[column] || "";',
-                '                        if (column === "remote") {',
-                '                            aValue = a[column] ? "Yes" : "No";',
-                '                            bValue = b[column] ? "Yes" : "No";',
-                '                        }',
-                '                        return order === "asc" ? aValue.localeCompare(bValue) : bValue.localeCompare(aValue);',
-                '                    });',
-                '                    renderTable(data);',
-                '                });',
-                '            });',
-                '            function applyFilters() {',
-                '                console.log("Applying filters");',
-                '                const selectedSources = Array.from(document.querySelectorAll("#sourceFilter .filter-checkbox:checked")).map(cb => cb.value);',
-                '                const selectedRemotes = Array.from(document.querySelectorAll("#remoteFilter .filter-checkbox:checked")).map(cb => cb.value);',
-                '                console.log("Selected Sources: " + selectedSources);',
-                '                console.log("Selected Remotes: " + selectedRemotes);',
-                '                const filteredData = data.filter(entry => {',
-                '                    const sourceMatch = selectedSources.length === 0 || selectedSources.includes(entry.source);',
-                '                    const remoteMatch = selectedRemotes.length === 0 || selectedRemotes.includes(entry.remote ? "Yes" : "No");',
-                '                    return sourceMatch && remoteMatch;',
-                '                });',
-                '                console.log("Filtered data to " + filteredData.length + " entries");',
-                '                renderTable(filteredData);',
-                '            }',
-                '            document.querySelectorAll(".filter-checkbox").forEach(cb => {',
-                '                cb.addEventListener("change", function() {',
-                '                    console.log("Checkbox changed: " + this.value + " is " + (this.checked ? "checked" : "unchecked"));',
-                '                    applyFilters();',
-                '                });',
-                '            });',
-                '            document.getElementById("resetFilter").addEventListener("click", function() {',
-                '                document.querySelectorAll(".filter-checkbox").forEach(cb => {',
-                '                    cb.checked = false;',
-                '                    console.log("Reset checkbox: " + cb.value);',
-                '                });',
-                '                console.log("Filters reset");',
-                '                renderTable(data);',
-                '            });',
-                '            document.getElementById("debugToggle").addEventListener("click", function() {',
-                '                const debugJson = document.getElementById("debugJson");',
-                '                debugJson.style.display = debugJson.style.display === "none" ? "block" : "none";',
-                '                console.log("Debug JSON toggled");',
-                '            });',
-                '        });',
-                '    </script>',
-                '</head>',
-                '<body>',
-                '    <h1>R.A.T.S. - Recruitment Alert Tracking System for CAPM</h1>',
-                '    <div class="filter">',
-                '        <div class="dropdown">',
-                '            <label>Select Sources: </label>',
-                '            <button class="dropdown-button">Select Sources</button>',
-                '            <div class="dropdown-content" id="sourceFilter">',
-                f'                {source_options}',
-                '            </div>',
-                '        </div>',
-                '        <div class="dropdown">',
-                '            <label>Select Remote: </label>',
-                '            <button class="dropdown-button">Select Remote</button>',
-                '            <div class="dropdown-content" id="remoteFilter">',
-                f'                {remote_options}',
-                '            </div>',
-                '        </div>',
-                '        <button id="resetFilter">Reset Filters</button>',
-                '    </div>',
-                '    <table id="jobTable">',
-                '        <thead>',
-                '            <tr>',
-                '                <th data-column="source">Source (Email)</th>',
-                '                <th data-column="job_position">Job Position</th>',
-                '                <th data-column="location">Location</th>',
-                '                <th data-column="minimum_qualifications">Minimum Requirements</th>',
-                '                <th data-column="remote">Remote</th>',
-                '            </tr>',
-                '        </thead>',
-                '        <tbody>',
-                f'            {static_table}',
-                '        </tbody>',
-                '    </table>',
-                '    <h2>Pivot Table</h2>',
-                '    <div id="pivotTable"></div>',
-                '    <button id="debugToggle">Toggle Debug JSON</button>',
-                f'    <pre id="debugJson">{html.escape(json_data_str)}</pre>',
-                '    <footer>Generated by process_email_dumps.py version 7.26</footer>',
-                '</body>',
-                '</html>'
-            ]
-            f.write('\n'.join(html_content))
+        with open(HTML_OUTPUT_PATH, 'wb', buffering=1 << 20) as f:
+            f.write(HTML_TEMPLATE.format(
+                json_data_str=json_data_str,
+                source_options=source_options,
+                remote_options=remote_options,
+                static_table=static_table,
+                debug_json=html.escape(json_data_str),
+            ).encode('utf-8'))
         
         # Generate separate log reports
-        with open(RATS_DATA_REPORT_PATH, 'w', encoding='utf-8') as f:
-            f.write("R.A.T.S. rats_data.json Report\n")
-            f.write("=============================\n\n")
-            with open(JSON_PATH, 'r', encoding='utf-8') as json_file:
-                f.write(json_file.read())
-        
-        with open(PARSED_JOBS_REPORT_PATH, 'w', encoding='utf-8') as f:
-            f.write("R.A.T.S. parsed_jobs_output.txt Report\n")
-            f.write("=====================================\n\n")
-            with open(TXT_OUTPUT_PATH, 'r', encoding='utf-8') as txt_file:
-                f.write(txt_file.read())
-        
-        with open(PARSE_ERRORS_REPORT_PATH, 'w', encoding='utf-8') as f:
-            f.write("R.A.T.S. parse_errors.log Report (Data Errors)\n")
-            f.write("============================================\n\n")
-            with open(os.path.join(LOG_DIR, 'parse_errors.log'), 'r', encoding='utf-8', errors='ignore') as log_file:
-                f.write(log_file.read())
+        write_report(RATS_DATA_REPORT_PATH, "R.A.T.S. rats_data.json Report\n=============================\n\n", JSON_PATH)
+        write_report(PARSED_JOBS_REPORT_PATH, "R.A.T.S. parsed_jobs_output.txt Report\n=====================================\n\n", TXT_OUTPUT_PATH)
+        write_report(PARSE_ERRORS_REPORT_PATH, "R.A.T.S. parse_errors.log Report (Data Errors)\n============================================\n\n", PARSE_ERRORS_LOG_PATH)
         
         logging.warning(f"Generated output files at {TXT_OUTPUT_PATH}, {HTML_OUTPUT_PATH}, {RATS_DATA_REPORT_PATH}, {PARSED_JOBS_REPORT_PATH}, {PARSE_ERRORS_REPORT_PATH}")
     except Exception as e:
@@ -356,18 +470,18 @@ def generate_output(data):
 def identify_source(content, from_header):
     try:
         if from_header:
-            for source, pattern in SENDER_PATTERNS.items():
-                if re.search(pattern, from_header, re.IGNORECASE):
+            for source, pattern in SENDER_RES.items():
+                if pattern.search(from_header):
                     return source
-        for source, pattern in SENDER_PATTERNS.items():
-            if re.search(pattern, content, re.IGNORECASE):
+        for source, pattern in SENDER_RES.items():
+            if pattern.search(content):
                 return source
-        for source, pattern in SOURCES.items():
-            if re.search(pattern, content, re.IGNORECASE):
+        for source, pattern in SOURCE_RES.items():
+            if pattern.search(content):
                 return source
-        if re.search(r'\bGoogle\b', content, re.IGNORECASE):
+        if GOOGLE_RE.search(content):
             return "GoogleCareers"
-        if re.search(r'\bLinkedIn\b', content, re.IGNORECASE):
+        if LINKEDIN_RE.search(content):
             return "LinkedIn"
         logging.warning(f"No source identified for content. First 20 lines:\n{content[:500]}")
         return None
@@ -375,13 +489,27 @@ def identify_source(content, from_header):
         logging.error(f"Error in source identification: {e}")
         return None
 
+# Log a problem with the section's first 20 lines as one multi-line warning (one record instead of one per line)
+def warn_first_lines(message, lines):
+    logging.warning(message + " First 20 lines:\n" + '\n'.join(f"Line {i}: {line}" for i, line in enumerate(lines[:20], 1)))
+
+# Emit the posting in progress (shared by the job-section scan and the GoogleCareers fallback) into the section's postings,
+# keyed by position in emission order; postings without a position or with a position already emitted are dropped
+def flush_posting(posting, job_postings):
+    position = posting['position']
+    if position and position not in job_postings:
+        job_postings[position] = {
+            'position': position,
+            'location': posting['location'] or 'Unknown',
+            'qualifications': '\n'.join(posting['qualifications']) or 'Unknown'
+        }
+
 # Parse email content
 def parse_email(content, filename, source):
     try:
         # Handle combined Glassdoor file with separators
-        sections = [content] if 'glassdoor_email_1.txt' not in filename else re.split(r'--- glassdoor_email_\d+\.txt ---', content)
+        sections = [content] if 'glassdoor_email_1.txt' not in filename else GLASSDOOR_SEPARATOR_RE.split(content)
         all_job_postings = []
-        all_seen_positions = set()
         from_header = 'Unknown'
         subject_text = 'Unknown'
         date_text = 'Unknown'
@@ -394,168 +522,126 @@ def parse_email(content, filename, source):
             section = section.strip()
             if not section:
                 continue
-            cleaned_lines = [line for line in section.splitlines() if not re.search(r'(None selected|Skip to content|Using Gmail with screen readers|to me|Google apps|–Conversations|Your job alert|has been created)', line, re.IGNORECASE)]
-            job_postings = []
-            seen_positions = set()
+            noise_search = NOISE_LINE_RE.search
+            cleaned_lines = [line for line in section.splitlines() if not noise_search(line.lower())]
+            job_postings = {}  # Position -> posting; the keys double as the section's seen positions
             
             # Parse first 50 lines for metadata
             for i, line in enumerate(cleaned_lines[:50], 1):
+                if from_header != 'Unknown' and subject_text != 'Unknown' and date_text != 'Unknown':
+                    break  # All three fields found; the remaining lines cannot change them
                 line = line.strip()
-                if from_header == 'Unknown' and re.search(r'[\w\.-]+@[\w\.-]+\.\w+', line, re.IGNORECASE):
-                    from_header = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', line, re.IGNORECASE).group()
-                if subject_text == 'Unknown' and line and not re.match(r'[\w\.-]+@[\w\.-]+\.\w+|^\w{3},\s+\w{3}\s+\d{1,2}(,\s+\d{4})?,\s+\d{1,2}:\d{2}\s*(?:AM|PM)', line, re.IGNORECASE):
-                    if re.search(r'job|jobs|career|careers|opportunity|opportunities|New job\(s\)|Project|Program|Assistant|alert|matching', line, re.IGNORECASE):
+                if from_header == 'Unknown' and (email_match := EMAIL_RE.search(line)):
+                    from_header = email_match.group()
+                if subject_text == 'Unknown' and line and not SUBJECT_EXCLUDE_RE.match(line):
+                    if SUBJECT_KEYWORD_RE.search(line):
                         subject_text = line
-                if date_text == 'Unknown' and re.match(r'^\w{3},\s+\w{3}\s+\d{1,2}(,\s+\d{4})?,\s+\d{1,2}:\d{2}\s*(?:AM|PM)\s*\(\d+ (?:hours|days) ago\)$|^\w{3}\s+\d{1,2}(,\s+\d{4})?,\s+\d{1,2}:\d{2}\s*(?:AM|PM)|^\w{3}\s+\d{1,2}(,\s+\d{4})?$|^Today$|\d{4}-\d{2}-\d{2}T|^\d{1,2}:\d{2}\s*(?:AM|PM)\s*\(\d+ (?:hours|days) ago\)$|^as-it-happens$', line, re.IGNORECASE):
+                if date_text == 'Unknown' and DATE_LINE_RE.match(line):
                     date_text = line
             
             # Fallback for metadata if not found
             if from_header == 'Unknown':
-                for i, line in enumerate(cleaned_lines, 1):
-                    if re.search(r'[\w\.-]+@[\w\.-]+\.\w+', line, re.IGNORECASE):
-                        from_header = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', line, re.IGNORECASE).group()
-                        logging.warning(f"Fallback sender identified for {filename}: {line}")
-                        break
+                # The first 50 lines were already searched with the same pattern above
+                index, email_match = first_matching_line(EMAIL_RE, cleaned_lines[50:])
+                if email_match:
+                    from_header = email_match.group()
+                    logging.warning(f"Fallback sender identified for {filename}: {cleaned_lines[50 + index]}")
             if subject_text == 'Unknown':
-                for i, line in enumerate(cleaned_lines, 1):
-                    if re.search(r'job|jobs|career|careers|opportunity|opportunities|alert|matching', line, re.IGNORECASE):
-                        subject_text = line
-                        logging.warning(f"Fallback subject identified for {filename}: {line}")
-                        break
+                index, subject_match = first_matching_line(FALLBACK_SUBJECT_RE, cleaned_lines, lowercase=True)
+                if subject_match:
+                    subject_text = cleaned_lines[index]
+                    logging.warning(f"Fallback subject identified for {filename}: {subject_text}")
             if date_text == 'Unknown':
-                for i, line in enumerate(cleaned_lines, 1):
-                    if re.search(r'\d{4}-\d{2}-\d{2}|\w{3},\s+\w{3}\s+\d{1,2}|as-it-happens|\d{1,2}:\d{2}\s*(?:AM|PM)', line, re.IGNORECASE):
-                        date_text = line
-                        logging.warning(f"Fallback date identified for {filename}: {line}")
-                        break
+                index, date_match = first_matching_line(FALLBACK_DATE_RE, cleaned_lines)
+                if date_match:
+                    date_text = cleaned_lines[index]
+                    logging.warning(f"Fallback date identified for {filename}: {date_text}")
             
-            # Log parsing results (only warnings/errors)
-            logging.warning(f"Parsed metadata for {filename}: sender={from_header}, subject={subject_text}, date={date_text}")
-            if from_header == 'Unknown':
-                logging.warning(f"Sender not identified for {filename}. First 20 lines:")
-                for i, line in enumerate(cleaned_lines[:20], 1):
-                    logging.warning(f"Line {i}: {line}")
-            if subject_text == 'Unknown':
-                logging.warning(f"Subject not identified for {filename}. First 20 lines:")
-                for i, line in enumerate(cleaned_lines[:20], 1):
-                    logging.warning(f"Line {i}: {line}")
-            if date_text == 'Unknown':
-                logging.warning(f"Date not identified for {filename}. First 20 lines:")
-                for i, line in enumerate(cleaned_lines[:20], 1):
-                    logging.warning(f"Line {i}: {line}")
+            # Log parsing results (only warnings/errors; per-file and per-line progress is DEBUG, with lazy %-formatting so it costs nothing at WARNING; the only %-style calls in this file)
+            logging.debug("Parsed metadata for %s: sender=%s, subject=%s, date=%s", filename, from_header, subject_text, date_text)
+            missing = [label for label, value in (("Sender", from_header), ("Subject", subject_text), ("Date", date_text)) if value == 'Unknown']
+            if missing:
+                warn_first_lines(f"{', '.join(missing)} not identified for {filename}.", cleaned_lines)
             
             # Extract job postings with Remote prioritization and enhanced GoogleCareers parsing
             job_section = False
-            current_posting = {'position': '', 'location': '', 'qualifications': ''}
-            start_str = r'Turn on job alerts for this search|Job alerts|New jobs|Your job listings for|New Jobs on LinkedIn|Jobs matching your search'
-            
-            # Enhanced patterns for GoogleCareers
-            position_pattern = r'(?:Manager|Engineer|Developer|Analyst|Specialist|Associate|Coordinator|Director|Senior|Junior|Lead|Executive|Officer|Consultant|Designer|Administrator|Technician|Operator|Supervisor|Architect|Scientist|Artist|Writer|Teacher|Professor|Nurse|Doctor|Lawyer|Accountant|Marketing|Sales|HR|IT|Support|Service|Project|Program|Assistant|HVAC|Customer Solutions|Cloud|AI|Machine Learning|Data Scientist|Product Manager|Business|Operations|Strategist|Researcher|Technical Lead|Acquisition|MarTech)\b(?:\s*(?:[-/&]\s*\w+)*)?'
-            location_pattern = r'(?:Bangkok|Manhattan|New York|Long Island City|Astoria|Remote|On-site|Hybrid|Thailand|Singapore|USA|India|London|San Francisco|Seattle|Mountain View|Sunnyvale|Atlanta|Chicago|Boston|Dublin|Zurich|Hyderabad|Bangalore|Tokyo|Sydney|Kuala Lumpur|Canada|NAMER|[A-Z][a-z]+,\s*[A-Z]{2}|place\s+.*|\b[A-Z][a-zA-Z\s]*(?:,\s*[A-Z]{2})?\b|Multiple locations)'
-            qualifications_pattern = r"(?:Bachelor\'s degree|Master\'s degree|PhD|years of experience|practical experience|Microsoft|AutoCAD|Architecture|Construction|Management|Full-time|Background check|Weekly pay|Equivalent experience|Ability to|Knowledge of|Proficient in|Experience with|Required|Preferred|Qualifications|Skills|Education|Minimum qualifications|Easy Apply|hour shift|Report writing|Commission pay|Oracle|PMP|Weekends as needed|Yearly pay|Mid-level|Multiple hires|Laboratory|Paid parental leave|Fluency in [A-Za-z]+|Certifications?|Technical skills|Strong communication|Team collaboration|\$[0-9]+K\s*-\s*\$[0-9]+K)"
+            current_posting = {'position': '', 'location': '', 'qualifications': []}  # Qualification lines are joined when the posting is emitted
             
             # Prioritize Remote and English job titles
             remote_job_position = 'Unknown'
             english_job_position = 'Unknown'
-            for line in cleaned_lines:
-                line = line.strip()
-                if re.search(start_str, line, re.IGNORECASE):
+            # Stripped non-blank lines with their case-folded form, built once for the main scan and the GoogleCareers fallback
+            posting_lines = [(line, line.lower()) for line in map(str.strip, cleaned_lines) if line]
+            for line, line_lc in posting_lines:
+                if contains_keyword(line_lc, JOB_SECTION_KEYWORDS):
                     job_section = True
                     continue
                 if job_section:
-                    if re.search(position_pattern, line, re.IGNORECASE):
-                        # Strict English check with allowed special characters
-                        if all(ord(c) < 128 or c in '-/&[]' for c in line) and not re.search(r'[^\x00-\x7F]', line):
-                            if current_posting['position'] and current_posting['position'] not in seen_positions:
-                                job_postings.append({
-                                    'position': current_posting['position'],
-                                    'location': current_posting['location'] or 'Unknown',
-                                    'qualifications': current_posting['qualifications'] or 'Unknown'
-                                })
-                                seen_positions.add(current_posting['position'])
-                            current_posting = {'position': line, 'location': '', 'qualifications': ''}
+                    if POSITION_RE.search(line_lc):
+                        # Strict English check: ASCII only (the allowed special characters -/&[] are ASCII)
+                        if line.isascii():
+                            flush_posting(current_posting, job_postings)
+                            current_posting = {'position': line, 'location': '', 'qualifications': []}
                             if english_job_position == 'Unknown':
                                 english_job_position = line
                             # Prioritize Remote positions
-                            if re.search(r'\bRemote\b|\(Remote\)|Hybrid|Remote eligible', line, re.IGNORECASE):
+                            if REMOTE_RE.search(line_lc):
                                 remote_job_position = line
                                 remote = True
-                                logging.warning(f"Remote position prioritized for {filename}: {line}")
+                                logging.debug("Remote position prioritized for %s: %s", filename, line)
                         else:
                             logging.warning(f"Non-English position skipped for {filename}: {line}")
                         continue
                     if line:
-                        if re.search(location_pattern, line, re.IGNORECASE) and not re.search(r'\d{1,2}:\d{2}\s*(?:AM|PM)', line, re.IGNORECASE):
+                        if LOCATION_RE.search(line_lc) and not TIME_RE.search(line_lc):
                             current_posting['location'] = line.replace('place ', '')
                             if location == 'Unknown':
                                 location = line.replace('place ', '')
                             # Prioritize Remote location
-                            if re.search(r'\bRemote\b|\(Remote\)|Hybrid|Remote eligible', line, re.IGNORECASE):
+                            if REMOTE_RE.search(line_lc):
                                 remote_job_position = current_posting['position'] or english_job_position
                                 remote = True
-                                logging.warning(f"Remote location prioritized for {filename}: {line}")
-                        elif re.search(qualifications_pattern, line, re.IGNORECASE) and not re.search(r'weeks of paid vacation', line, re.IGNORECASE):
-                            if current_posting['qualifications']:
-                                current_posting['qualifications'] += '\n' + line
-                            else:
-                                current_posting['qualifications'] = line
+                                logging.debug("Remote location prioritized for %s: %s", filename, line)
+                        elif QUALIFICATIONS_RE.search(line_lc) and 'weeks of paid vacation' not in line_lc:
+                            current_posting['qualifications'].append(line)
                             if minimum_qualifications == 'Unknown':
                                 minimum_qualifications = line
             
             # Enhanced fallback parsing for GoogleCareers
             if source == 'GoogleCareers' and not job_postings:
                 logging.warning(f"No job postings found for {filename}. Attempting enhanced fallback parsing.")
-                for i, line in enumerate(cleaned_lines):
-                    line = line.strip()
-                    if re.search(r'\b[A-Z][a-zA-Z\s]*(?:Manager|Engineer|Specialist|Analyst|Developer|Consultant|Coordinator|Director|Customer Solutions|Cloud|AI|Machine Learning|Data Scientist|Product Manager|Business|Operations|Strategist|Researcher|Technical Lead|Acquisition|MarTech)\b(?:\s*(?:[-/&]\s*\w+)*)?', line, re.IGNORECASE):
-                        if all(ord(c) < 128 or c in '-/&[]' for c in line) and not re.search(r'[^\x00-\x7F]', line):
-                            if current_posting['position'] and current_posting['position'] not in seen_positions:
-                                job_postings.append({
-                                    'position': current_posting['position'],
-                                    'location': current_posting['location'] or 'Unknown',
-                                    'qualifications': current_posting['qualifications'] or 'Unknown'
-                                })
-                                seen_positions.add(current_posting['position'])
-                            current_posting = {'position': line, 'location': '', 'qualifications': ''}
+                for line, line_lc in posting_lines:
+                    if GOOGLE_POSITION_RE.search(line_lc):
+                        if line.isascii():
+                            flush_posting(current_posting, job_postings)
+                            current_posting = {'position': line, 'location': '', 'qualifications': []}
                             if english_job_position == 'Unknown':
                                 english_job_position = line
-                            if re.search(r'\bRemote\b|\(Remote\)|Hybrid|Remote eligible', line, re.IGNORECASE):
+                            if REMOTE_RE.search(line_lc):
                                 remote_job_position = line
                                 remote = True
                         continue
-                    if re.search(location_pattern, line, re.IGNORECASE) and not re.search(r'\d{1,2}:\d{2}\s*(?:AM|PM)', line, re.IGNORECASE):
+                    if LOCATION_RE.search(line_lc) and not TIME_RE.search(line_lc):
                         current_posting['location'] = line
                         if location == 'Unknown':
                             location = line
-                        if re.search(r'\bRemote\b|\(Remote\)|Hybrid|Remote eligible', line, re.IGNORECASE):
+                        if REMOTE_RE.search(line_lc):
                             remote = True
                         continue
-                    if re.search(qualifications_pattern, line, re.IGNORECASE) and not re.search(r'weeks of paid vacation', line, re.IGNORECASE):
-                        if current_posting['qualifications']:
-                            current_posting['qualifications'] += '\n' + line
-                        else:
-                            current_posting['qualifications'] = line
+                    if QUALIFICATIONS_RE.search(line_lc) and 'weeks of paid vacation' not in line_lc:
+                        current_posting['qualifications'].append(line)
                         if minimum_qualifications == 'Unknown':
                             minimum_qualifications = line
             
-            if current_posting['position'] and current_posting['position'] not in seen_positions:
-                job_postings.append({
-                    'position': current_posting['position'],
-                    'location': current_posting['location'] or 'Unknown',
-                    'qualifications': current_posting['qualifications'] or 'Unknown'
-                })
-                seen_positions.add(current_posting['position'])
+            flush_posting(current_posting, job_postings)
             
             # Aggregate job postings
-            for posting in job_postings:
-                all_job_postings.append(posting)
+            all_job_postings.extend(job_postings.values())
         
         if not all_job_postings:
-            logging.warning(f"No job postings identified for {filename}. First 20 lines:")
-            for i, line in enumerate(cleaned_lines[:20], 1):
-                logging.warning(f"Line {i}: {line}")
+            warn_first_lines(f"No job postings identified for {filename}.", cleaned_lines)
         else:
-            logging.warning(f"Extracted {len(all_job_postings)} job postings for {filename}")
+            logging.debug("Extracted %d job postings for %s", len(all_job_postings), filename)
         
         # Select the first remote job or first English job
         job_position = remote_job_position if remote_job_position != 'Unknown' else english_job_position
@@ -566,51 +652,94 @@ def parse_email(content, filename, source):
         logging.error(f"Error parsing {filename}: {e}")
         raise
 
+# SHA-1 of a dump's text; stored as content_sha1 and used to recognise dumps already in rats_data.json
+def content_digest(content):
+    return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+# SHA-1s of the dumps already stored; filled by process_email_dumps before the worker pool is forked, so workers
+# inherit it once instead of receiving a pickled copy with every task
+INGESTED = set()
+
+# Read, identify and parse one dump (module level so worker processes can run it); returns the content's SHA-1 rather than the content
+# and skips identification and parsing when that SHA-1 is in INGESTED
+def parse_dump(file_path, filename):
+    content = read_dump(file_path)
+    content_sha1 = content_digest(content)
+    if content_sha1 in INGESTED:
+        return content_sha1, None, None
+    source = identify_source(content, '')
+    if source is None:
+        return content_sha1, None, None
+    return content_sha1, source, parse_email(content, filename, source)
+
 # Process email dumps
 def process_email_dumps():
     json_data = init_json()
+    processed_at = datetime.now().isoformat()  # One timestamp for every entry saved in this run
     success_count = 0
     fail_count = 0
+    skipped_count = 0
     
     try:
-        for filename in os.listdir(EMAIL_DUMPS_DIR):
-            if filename.endswith('.txt'):
-                file_path = os.path.join(EMAIL_DUMPS_DIR, filename)
-                try:
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                    
-                    source = identify_source(content, '')
-                    if source is None:
-                        logging.warning(f"Unknown source for {filename}. Aborting processing.")
-                        fail_count += 1
-                        continue
-                    
-                    from_header, subject, date, job_position, location, minimum_qualifications, job_postings, remote = parse_email(content, filename, source)
-                    
-                    processed_at = datetime.now().isoformat()
-                    entry = {
-                        'id': len(json_data) + 1,
-                        'filename': filename,
-                        'sender': from_header,
-                        'subject': subject,
-                        'date': date,
-                        'source': source,
-                        'content': content,
-                        'processed_at': processed_at,
-                        'job_position': job_position,
-                        'location': location,
-                        'minimum_qualifications': minimum_qualifications,
-                        'job_postings': job_postings,
-                        'remote': remote
-                    }
-                    save_to_json(json_data, entry)
-                    success_count += 1
-                except Exception as e:
-                    logging.error(f"Error processing {filename}: {e}")
+        # Dumps already stored, by content SHA-1 (entries written before content_sha1 existed still carry the content itself)
+        ingested = INGESTED
+        ingested.clear()
+        for entry in json_data:
+            if 'content_sha1' in entry:
+                ingested.add(entry['content_sha1'])
+            elif 'content' in entry:
+                ingested.add(content_digest(entry['content']))
+        
+        with os.scandir(EMAIL_DUMPS_DIR) as it:
+            dump_files = [dump for dump in it if dump.name.endswith('.txt') and dump.is_file()]
+        
+        # Parse dumps in forked worker processes when there is more than one dump and CPU (forked workers
+        # keep this process's log file); entries are still numbered and saved here in directory order
+        futures = [None] * len(dump_files)
+        workers = min(len(dump_files), os.cpu_count() or 1)
+        if workers > 1 and 'fork' in multiprocessing.get_all_start_methods():
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('fork')) as executor:
+                futures = [executor.submit(parse_dump, dump.path, dump.name) for dump in dump_files]
+        for dump, future in zip(dump_files, futures):
+            filename = dump.name
+            try:
+                content_sha1, source, parsed = future.result() if future else parse_dump(dump.path, filename)
+                if content_sha1 in ingested:
+                    skipped_count += 1  # Unchanged since an earlier run (or a copy of a dump saved in this one)
+                    continue
+                if source is None:
+                    logging.warning(f"Unknown source for {filename}. Aborting processing.")
                     fail_count += 1
                     continue
-        print(f"Processed {success_count} files successfully, {fail_count} failed. Details in {LOG_DIR}/parse_errors.log")
+                
+                from_header, subject, date, job_position, location, minimum_qualifications, job_postings, remote = parsed
+                
+                entry = {
+                    'id': len(json_data) + 1,
+                    'filename': filename,
+                    'sender': from_header,
+                    'subject': subject,
+                    'date': date,
+                    'source': source,
+                    'content_path': os.path.relpath(dump.path, PROJECT_ROOT),  # The dump itself stays on disk instead of being copied into every entry
+                    'content_sha1': content_sha1,
+                    'processed_at': processed_at,
+                    'job_position': job_position,
+                    'location': location,
+                    'minimum_qualifications': minimum_qualifications,
+                    'job_postings': job_postings,
+                    'remote': remote
+                }
+                save_to_json(json_data, entry)
+                ingested.add(content_sha1)
+                success_count += 1
+            except Exception as e:
+                logging.error(f"Error processing {filename}: {e}")
+                fail_count += 1
+                continue
+        if success_count:
+            write_json(json_data)
+        print(f"Processed {success_count} files successfully, {fail_count} failed, {skipped_count} already ingested. Details in {LOG_DIR}/parse_errors.log")
         generate_output(json_data)
     except Exception as e:
         logging.error(f"Processing error: {e}")